@@ -0,0 +1,106 @@
+"""add counters
+
+Revision ID: b7e3d0a95c41
+Revises: 4f2b8e61c0d7
+Create Date: 2026-10-18 10:32:47.106224
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d0a95c41'
+down_revision: str | None = '4f2b8e61c0d7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNT_SUBMENUS_FUNCTION = """
+CREATE OR REPLACE FUNCTION count_submenus() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.menu_id IS NOT DISTINCT FROM OLD.menu_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE menu
+        SET submenus_count = submenus_count - 1, dishes_count = dishes_count - OLD.dishes_count
+        WHERE id = OLD.menu_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE menu
+        SET submenus_count = submenus_count + 1, dishes_count = dishes_count + NEW.dishes_count
+        WHERE id = NEW.menu_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_DISHES_FUNCTION = """
+CREATE OR REPLACE FUNCTION count_dishes() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.submenu_id IS NOT DISTINCT FROM OLD.submenu_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE submenu SET dishes_count = dishes_count - 1 WHERE id = OLD.submenu_id;
+        UPDATE menu SET dishes_count = menu.dishes_count - 1
+        FROM submenu
+        WHERE submenu.id = OLD.submenu_id AND menu.id = submenu.menu_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE submenu SET dishes_count = dishes_count + 1 WHERE id = NEW.submenu_id;
+        UPDATE menu SET dishes_count = menu.dishes_count + 1
+        FROM submenu
+        WHERE submenu.id = NEW.submenu_id AND menu.id = submenu.menu_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.add_column('menu', sa.Column('submenus_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('menu', sa.Column('dishes_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('submenu', sa.Column('dishes_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute("""
+        UPDATE submenu
+        SET dishes_count = (SELECT count(*) FROM dish WHERE dish.submenu_id = submenu.id)
+    """)
+    op.execute("""
+        UPDATE menu
+        SET submenus_count = (SELECT count(*) FROM submenu WHERE submenu.menu_id = menu.id),
+            dishes_count = (SELECT coalesce(sum(dishes_count), 0) FROM submenu WHERE submenu.menu_id = menu.id)
+    """)
+
+    op.execute(COUNT_SUBMENUS_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER count_submenus AFTER INSERT OR DELETE OR UPDATE OF menu_id ON submenu
+        FOR EACH ROW EXECUTE FUNCTION count_submenus()
+    """)
+    op.execute(COUNT_DISHES_FUNCTION)
+    op.execute("""
+        CREATE TRIGGER count_dishes AFTER INSERT OR DELETE OR UPDATE OF submenu_id ON dish
+        FOR EACH ROW EXECUTE FUNCTION count_dishes()
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER count_dishes ON dish')
+    op.execute('DROP FUNCTION count_dishes()')
+    op.execute('DROP TRIGGER count_submenus ON submenu')
+    op.execute('DROP FUNCTION count_submenus()')
+
+    op.drop_column('submenu', 'dishes_count')
+    op.drop_column('menu', 'dishes_count')
+    op.drop_column('menu', 'submenus_count')
@@ -0,0 +1,38 @@
+"""add indexes
+
+Revision ID: e91c5a27f8b3
+Revises: b7e3d0a95c41
+Create Date: 2026-10-18 10:58:03.731590
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e91c5a27f8b3'
+down_revision: str | None = 'b7e3d0a95c41'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+INDEXES = (
+    ('ix_menu_title', 'menu', 'title'),
+    ('ix_submenu_title', 'submenu', 'title'),
+    ('ix_submenu_menu_id', 'submenu', 'menu_id'),
+    ('ix_dish_title', 'dish', 'title'),
+    ('ix_dish_submenu_id', 'dish', 'submenu_id'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes are built,
+    # but cannot run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for index_name, table_name, column_name in INDEXES:
+            op.create_index(index_name, table_name, [column_name], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, _ in reversed(INDEXES):
+            op.drop_index(index_name, table_name=table_name, postgresql_concurrently=True, if_exists=True)
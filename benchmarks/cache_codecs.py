@@ -0,0 +1,82 @@
+"""
+Compares cache payload codecs against the former pickle path.
+
+Run with ``python -m benchmarks.cache_codecs``.
+"""
+import pickle
+import timeit
+import uuid
+from typing import Any, Callable
+
+from utils import schemas
+from utils.serializers import CacheSerializer, JSONBody
+
+ROUNDS = 200
+
+
+def build_menus_tree(menus: int = 5, submenus: int = 5, dishes: int = 10) -> list[schemas.MenuOutWithSubmenusAndDishes]:
+    return [
+        schemas.MenuOutWithSubmenusAndDishes(
+            id=uuid.uuid4(),
+            title=f'Menu {i}',
+            description=f'Menu description {i}',
+            submenus=[
+                schemas.Submenu(
+                    id=uuid.uuid4(),
+                    title=f'Submenu {j}',
+                    description=f'Submenu description {j}',
+                    dishes=[
+                        schemas.DishOut(
+                            id=uuid.uuid4(),
+                            title=f'Dish {k}',
+                            description=f'Dish description {k}',
+                            price=f'{k}.50',
+                        )
+                        for k in range(dishes)
+                    ],
+                )
+                for j in range(submenus)
+            ],
+        )
+        for i in range(menus)
+    ]
+
+
+def build_dishes(count: int = 100) -> list[schemas.DishOut]:
+    return [
+        schemas.DishOut(id=uuid.uuid4(), title=f'Dish {i}', description=f'Dish description {i}', price=f'{i}.50')
+        for i in range(count)
+    ]
+
+
+def measure(dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any], value: Any) -> tuple[float, float, int]:
+    payload = dumps(value)
+    encode_time = timeit.timeit(lambda: dumps(value), number=ROUNDS) / ROUNDS
+    decode_time = timeit.timeit(lambda: loads(payload), number=ROUNDS) / ROUNDS
+
+    return encode_time, decode_time, len(payload)
+
+
+def main() -> None:
+    entries = {
+        'dishes_list (100)': build_dishes(),
+        'menus_list_with_submenus_and_dishes (250 dishes)': build_menus_tree(),
+    }
+    codecs: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+        'pickle': (pickle.dumps, pickle.loads),
+        'orjson': (CacheSerializer('orjson').dumps, CacheSerializer('orjson').loads),
+        'msgpack': (CacheSerializer('msgpack').dumps, CacheSerializer('msgpack').loads),
+        'body': (lambda value: CacheSerializer().dumps(JSONBody.from_value(value)), CacheSerializer().loads),
+    }
+
+    for entry_name, value in entries.items():
+        print(entry_name)
+
+        for codec_name, (dumps, loads) in codecs.items():
+            encode_time, decode_time, size = measure(dumps, loads, value)
+            print(f'  {codec_name:<8} encode {encode_time * 1e6:9.1f} us  '
+                  f'decode {decode_time * 1e6:9.1f} us  {size:7d} bytes')
+
+
+if __name__ == '__main__':
+    main()
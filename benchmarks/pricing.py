@@ -0,0 +1,64 @@
+"""
+Compares the ``Decimal`` pricing path and the DTO building against the former per-dish float path.
+
+Run with ``python -m benchmarks.pricing``.
+"""
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+from database.models import Dish
+from services.pricing_service import PricingService
+
+ROUNDS = 5
+SIZES = (10_000, 100_000)
+
+
+def build_dishes(count: int) -> list[Dish]:
+    return [
+        Dish(id=uuid.uuid4(), title=f'Dish {i}', description=f'Dish description {i}', price=f'{i % 1000}.{i % 100:02d}')
+        for i in range(count)
+    ]
+
+
+async def price_with_floats(dishes: list[Dish], discounts: dict[Any, int]) -> list[str]:
+    prices = []
+
+    for dish in dishes:
+        price = float(dish.price)
+        discount_amount = (price * float(discounts.get(dish.id, 0))) / 100
+        prices.append(str(round(price - discount_amount, 2)))
+
+    return prices
+
+
+async def measure(func: Callable[[], Awaitable[Any]]) -> float:
+    started = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        await func()
+
+    return (time.perf_counter() - started) / ROUNDS
+
+
+async def main() -> None:
+    pricing_service = PricingService()
+
+    for size in SIZES:
+        dishes = build_dishes(size)
+        discounts = {dish.id: i % 50 for i, dish in enumerate(dishes) if i % 3}
+        paths: dict[str, Callable[[], Awaitable[Any]]] = {
+            'float': lambda: price_with_floats(dishes, discounts),
+            'decimal': lambda: pricing_service._price_with_decimals(dishes, discounts),
+            'dtos': lambda: pricing_service.price_dishes(dishes, discounts),
+        }
+
+        print(f'{size} dishes')
+
+        for path_name, func in paths.items():
+            print(f'  {path_name:<8} {await measure(func) * 1e3:9.1f} ms')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
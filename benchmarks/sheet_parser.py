@@ -0,0 +1,87 @@
+"""
+Compares the single-pass sheet parser against the former dict parsers and row digests pass.
+
+Run with ``python -m benchmarks.sheet_parser``.
+"""
+import asyncio
+import hashlib
+import time
+import uuid
+from typing import Any, Awaitable, Callable
+
+import orjson
+
+from parsers.google_sheet_parser import GoogleSheetsParser
+
+ROUNDS = 3
+SIZES = (10_000, 100_000)
+
+
+def build_rows(count: int, submenus: int = 10, dishes: int = 50) -> list[list]:
+    rows: list[list] = []
+
+    while len(rows) < count:
+        rows.append([str(uuid.uuid4()), f'Menu {len(rows)}', 'Menu description'])
+
+        for _ in range(submenus):
+            rows.append(['', str(uuid.uuid4()), f'Submenu {len(rows)}', 'Submenu description'])
+            rows.extend(
+                ['', '', str(uuid.uuid4()), f'Dish {len(rows) + i}', 'Dish description', f'{i}.50', str(i % 30)]
+                for i in range(dishes)
+            )
+
+    return rows[:count]
+
+
+async def parse_with_two_passes(data: list[list]) -> tuple[list[dict], list[dict], dict[str, str]]:
+    result: list[dict] = []
+    for i in data:
+        if i[0]:
+            result.append({'id': i[0], 'title': i[1], 'description': i[2], 'submenus': []})
+        elif i[1]:
+            result[-1]['submenus'].append({'id': i[1], 'title': i[2], 'description': i[3], 'dishes': []})
+        elif i[2]:
+            result[-1]['submenus'][-1]['dishes'].append(
+                {'id': i[2], 'title': i[3], 'description': i[4], 'price': i[5]}
+            )
+
+    dishes = [
+        {'id': i[2], 'title': i[3], 'description': i[4], 'price': i[5], 'discount': int(i[6]) if len(i) == 7 else 0}
+        for i in data if not i[1] and i[2]
+    ]
+
+    row_digests = {
+        next(cell for cell in i[:3] if cell): hashlib.blake2b(orjson.dumps(i), digest_size=16).hexdigest()
+        for i in data if any(i[:3])
+    }
+
+    return result, dishes, row_digests
+
+
+async def measure(func: Callable[[], Awaitable[Any]]) -> float:
+    started = time.perf_counter()
+
+    for _ in range(ROUNDS):
+        await func()
+
+    return (time.perf_counter() - started) / ROUNDS
+
+
+async def main() -> None:
+    parser = GoogleSheetsParser()
+
+    for size in SIZES:
+        rows = build_rows(size)
+        paths: dict[str, Callable[[], Awaitable[Any]]] = {
+            'dicts': lambda: parse_with_two_passes(rows),
+            'single-pass': lambda: parser.parse(rows),
+        }
+
+        print(f'{size} rows')
+
+        for path_name, func in paths.items():
+            print(f'  {path_name:<12} {await measure(func) * 1e3:9.1f} ms')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
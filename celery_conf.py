@@ -1,9 +1,19 @@
 import asyncio
 
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
+from celery.utils.log import current_process_index
+from prometheus_client import start_http_server
 
-from database.database import async_session
-from services.task_service import TaskService
+from config import (
+    CELERY_WORKER_DB_POOL_SIZE,
+    CELERY_WORKER_METRICS_PORT,
+    CELERY_WORKER_REDIS_MAX_CONNECTIONS,
+    SYNC_POLL_INTERVAL,
+)
+from database.database import dispose_engine, init_engine
+from database.redis_pool import close_redis_pool, init_redis_pool
+from services.sync_service import SyncService
 
 celery_app = Celery(
     'tasks',
@@ -11,19 +21,62 @@ celery_app = Celery(
     backend='rpc://',
 )
 
+worker_loop: asyncio.AbstractEventLoop | None = None
+
 
 @celery_app.on_after_configure.connect
 def setup_periodic_tasks(sender, **kwargs):
-    sender.add_periodic_task(15, check_google_sheets.s())
+    sender.add_periodic_task(SYNC_POLL_INTERVAL, check_google_sheets.s())
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Give every worker process its own event loop, database engine, Redis pool and metrics endpoint."""
+    global worker_loop
+
+    worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(worker_loop)
+
+    init_engine(pool_size=CELERY_WORKER_DB_POOL_SIZE, max_overflow=0)
+    init_redis_pool(max_connections=CELERY_WORKER_REDIS_MAX_CONNECTIONS)
+    start_worker_metrics_server()
+
+
+def start_worker_metrics_server() -> int:
+    """
+    Serve this process' metrics registry, which the API's /metrics cannot see.
+
+    Pool process ``n`` listens on ``CELERY_WORKER_METRICS_PORT + n``.
+    """
+    port = CELERY_WORKER_METRICS_PORT + (current_process_index(base=0) or 0)
+    start_http_server(port)
+
+    return port
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    global worker_loop
+
+    if worker_loop is None:
+        return
+
+    worker_loop.run_until_complete(dispose_engine())
+    worker_loop.run_until_complete(close_redis_pool())
+    worker_loop.run_until_complete(worker_loop.shutdown_asyncgens())
+    worker_loop.close()
+    worker_loop = None
+
+
+def run_in_worker_loop(coroutine):
+    loop = worker_loop or asyncio.get_event_loop()
+    return loop.run_until_complete(coroutine)
 
 
 @celery_app.task
-def check_google_sheets():
-    loop = asyncio.get_event_loop()
-    result = loop.run_until_complete(check_google_sheets_async())
-    return result
+def check_google_sheets(force=False):
+    return run_in_worker_loop(check_google_sheets_async(force))
 
 
-async def check_google_sheets_async():
-    async with async_session() as session:
-        return await TaskService(session).check_data()
+async def check_google_sheets_async(force=False):
+    return await SyncService().run(force)
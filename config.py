@@ -1 +1,29 @@
 BASE_API_URL = '/api/v1'
+CACHE_CODEC = 'orjson'
+LOCAL_CACHE_ENABLED = True
+LOCAL_CACHE_MAXSIZE = 1024
+LOCAL_CACHE_TTL = 10
+CACHE_INVALIDATION_CHANNEL = 'cache_invalidation'
+CACHE_LOCK_TIMEOUT = 10
+CACHE_LOCK_WAIT = 5
+CACHE_TTL = 300
+CACHE_STALE_AFTER = 60
+CACHE_WARMUP_CONCURRENCY = 4
+GOOGLE_SHEETS_CREDENTIALS_FILE = 'admin/swift-adviser-413809-eab9b0b5a6ca.json'
+GOOGLE_SHEETS_MAX_WORKERS = 4
+GOOGLE_SHEETS_SPREADSHEET_KEY = ''
+GOOGLE_SHEETS_SPREADSHEET_NAME = 'Menu'
+GOOGLE_SHEETS_TIMEOUT = 10
+DATA_SOURCE = 'google_sheets'
+DATA_SOURCE_FILE = 'admin/Menu.csv'
+SYNC_BATCH_SIZE = 1000
+CELERY_WORKER_DB_POOL_SIZE = CACHE_WARMUP_CONCURRENCY + 1
+CELERY_WORKER_REDIS_MAX_CONNECTIONS = 10
+SYNC_LOCK_TTL = 60
+SYNC_POLL_INTERVAL = 15
+SYNC_MAX_INTERVAL = 600
+SYNC_TRIGGER_DEBOUNCE = 5
+SYNC_API_TOKEN = ''
+SYNC_MARKER_TTL = 86400
+REDIS_POOL_TIMEOUT = 5
+CELERY_WORKER_METRICS_PORT = 9100
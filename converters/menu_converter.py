@@ -2,8 +2,8 @@ from typing import Any, Sequence
 
 from sqlalchemy import Row
 
-from repositories.discount_repository import DiscountRepository
 from services.google_sheet_service import GoogleSheetService
+from services.pricing_service import PricingService
 from utils import schemas
 
 
@@ -37,6 +37,9 @@ class MenuConverter:
             self, menus: Sequence[Row[Any]]
     ) -> list[schemas.MenuOutWithSubmenusAndDishes]:
         menus_result = []
+        dishes = [dish for menu_row in menus for submenu in menu_row[0].submenus for dish in submenu.dishes]
+        discounts = await GoogleSheetService().get_discounts(dishes)
+        priced_dishes = iter(await PricingService().price_dishes(dishes, discounts))
 
         for menu_row in menus:
             menu = menu_row[0]
@@ -54,15 +57,9 @@ class MenuConverter:
                     description=submenu.description,
                     dishes=[]
                 )
-                for dish in submenu.dishes:
-                    dish_data = await GoogleSheetService().get_dish_data_by_title(dish.title)
+                submenu_out.dishes.extend(next(priced_dishes) for _ in submenu.dishes)
 
-                    if dish_data:
-                        dish = await DiscountRepository().set_discount_for_dish(dish, dish_data['discount'])
-
-                    submenu_out.dishes.append(dish)
-
-                menu_out.submenus.append(submenu)
+                menu_out.submenus.append(submenu_out)
 
             menus_result.append(menu_out)
 
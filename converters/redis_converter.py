@@ -1,5 +1,8 @@
+import re
 from typing import Any
 
+UUID_PATTERN = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}')
+
 
 class RedisConverter:
 
@@ -10,3 +13,9 @@ class RedisConverter:
             key = str(key)
             result_key.append(key)
         return '_'.join(result_key)
+
+    async def generate_tag_key(self, tag: Any) -> str:
+        return f'tag_{tag}'
+
+    async def generate_family(self, key: str) -> str:
+        return UUID_PATTERN.sub('{id}', key)
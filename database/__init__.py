@@ -1 +1 @@
-from . import database, models
+from . import database, models, redis_pool
@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy import DDL, Column, ForeignKey, Integer, String, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base, relationship
 
@@ -10,8 +10,11 @@ Base: Any = declarative_base()
 class Menu(Base):
     __tablename__ = 'menu'
     id = Column(UUID(as_uuid=True), primary_key=True)
-    title = Column(String)
+    title = Column(String, index=True)
     description = Column(String)
+    source_hash = Column(String(32))
+    submenus_count = Column(Integer, nullable=False, server_default='0')
+    dishes_count = Column(Integer, nullable=False, server_default='0')
     submenus = relationship(
         'Submenu', back_populates='menu', cascade='all, delete-orphan'
     )
@@ -20,9 +23,11 @@ class Menu(Base):
 class Submenu(Base):
     __tablename__ = 'submenu'
     id = Column(UUID(as_uuid=True), primary_key=True)
-    title = Column(String)
+    title = Column(String, index=True)
     description = Column(String)
-    menu_id = Column(UUID(as_uuid=True), ForeignKey('menu.id'))
+    source_hash = Column(String(32))
+    dishes_count = Column(Integer, nullable=False, server_default='0')
+    menu_id = Column(UUID(as_uuid=True), ForeignKey('menu.id'), index=True)
     menu = relationship('Menu', back_populates='submenus')
     dishes = relationship(
         'Dish', back_populates='submenu', cascade='all, delete-orphan'
@@ -32,8 +37,79 @@ class Submenu(Base):
 class Dish(Base):
     __tablename__ = 'dish'
     id = Column(UUID(as_uuid=True), primary_key=True)
-    title = Column(String)
+    title = Column(String, index=True)
     description = Column(String)
     price = Column(String)
-    submenu_id = Column(UUID(as_uuid=True), ForeignKey('submenu.id'))
+    source_hash = Column(String(32))
+    submenu_id = Column(UUID(as_uuid=True), ForeignKey('submenu.id'), index=True)
     submenu = relationship('Submenu', back_populates='dishes')
+
+
+# The counters are kept up to date by triggers, so every write path (ORM, bulk
+# upserts and deletes, cascades) maintains them within its own transaction.
+COUNT_SUBMENUS_FUNCTION = """
+CREATE OR REPLACE FUNCTION count_submenus() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.menu_id IS NOT DISTINCT FROM OLD.menu_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE menu
+        SET submenus_count = submenus_count - 1, dishes_count = dishes_count - OLD.dishes_count
+        WHERE id = OLD.menu_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE menu
+        SET submenus_count = submenus_count + 1, dishes_count = dishes_count + NEW.dishes_count
+        WHERE id = NEW.menu_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_SUBMENUS_TRIGGER = """
+CREATE TRIGGER count_submenus AFTER INSERT OR DELETE OR UPDATE OF menu_id ON submenu
+FOR EACH ROW EXECUTE FUNCTION count_submenus()
+"""
+
+COUNT_DISHES_FUNCTION = """
+CREATE OR REPLACE FUNCTION count_dishes() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.submenu_id IS NOT DISTINCT FROM OLD.submenu_id THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE submenu SET dishes_count = dishes_count - 1 WHERE id = OLD.submenu_id;
+        UPDATE menu SET dishes_count = menu.dishes_count - 1
+        FROM submenu
+        WHERE submenu.id = OLD.submenu_id AND menu.id = submenu.menu_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE submenu SET dishes_count = dishes_count + 1 WHERE id = NEW.submenu_id;
+        UPDATE menu SET dishes_count = menu.dishes_count + 1
+        FROM submenu
+        WHERE submenu.id = NEW.submenu_id AND menu.id = submenu.menu_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_DISHES_TRIGGER = """
+CREATE TRIGGER count_dishes AFTER INSERT OR DELETE OR UPDATE OF submenu_id ON dish
+FOR EACH ROW EXECUTE FUNCTION count_dishes()
+"""
+
+event.listen(Submenu.__table__, 'after_create', DDL(COUNT_SUBMENUS_FUNCTION))
+event.listen(Submenu.__table__, 'after_create', DDL(COUNT_SUBMENUS_TRIGGER))
+event.listen(Submenu.__table__, 'after_drop', DDL('DROP FUNCTION IF EXISTS count_submenus()'))
+event.listen(Dish.__table__, 'after_create', DDL(COUNT_DISHES_FUNCTION))
+event.listen(Dish.__table__, 'after_create', DDL(COUNT_DISHES_TRIGGER))
+event.listen(Dish.__table__, 'after_drop', DDL('DROP FUNCTION IF EXISTS count_dishes()'))
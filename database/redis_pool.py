@@ -0,0 +1,31 @@
+from aioredis import BlockingConnectionPool, Redis
+
+from config import REDIS_POOL_TIMEOUT
+
+redis_pool: BlockingConnectionPool | None = None
+
+
+def init_redis_pool(max_connections: int = 50, timeout: int = REDIS_POOL_TIMEOUT) -> BlockingConnectionPool:
+    """
+    Create the shared pool; once all connections are in use, callers wait up to
+    ``timeout`` seconds for one to be released instead of failing at once.
+    """
+    global redis_pool
+
+    redis_pool = BlockingConnectionPool.from_url('redis://redis_ylab', max_connections=max_connections, timeout=timeout)
+    return redis_pool
+
+
+def get_redis() -> Redis:
+    if redis_pool is None:
+        init_redis_pool()
+
+    return Redis(connection_pool=redis_pool)
+
+
+async def close_redis_pool() -> None:
+    global redis_pool
+
+    if redis_pool is not None:
+        await redis_pool.disconnect()
+        redis_pool = None
@@ -1,16 +1,49 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncGenerator
+
 import uvicorn
 from fastapi import FastAPI
 
 from config import BASE_API_URL
+from database.redis_pool import close_redis_pool, init_redis_pool
+from repositories.redis_repository import RedisRepository
 from routes.routes_for_dish import dishes_router
 from routes.routes_for_menu import menus_router
+from routes.routes_for_metrics import metrics_router
 from routes.routes_for_submenu import submenus_router
+from routes.routes_for_sync import sync_router
+from services.cache_warmup_service import CacheWarmupService
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    init_redis_pool()
+    invalidation_listener = asyncio.create_task(RedisRepository().listen_for_invalidations())
+
+    try:
+        await CacheWarmupService().warm_up()
+    except Exception:
+        logger.exception('Cache warm-up failed')
+
+    yield
+
+    invalidation_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await invalidation_listener
+    await close_redis_pool()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(menus_router, prefix=BASE_API_URL)
 app.include_router(submenus_router, prefix=BASE_API_URL)
 app.include_router(dishes_router, prefix=BASE_API_URL)
+app.include_router(sync_router, prefix=BASE_API_URL)
+app.include_router(metrics_router)
 
 if __name__ == '__main__':
     uvicorn.run('main:app', reload=True)
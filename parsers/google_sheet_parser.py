@@ -1,46 +1,166 @@
+import asyncio
+import hashlib
+import re
+from typing import Any, Iterable, Iterator, NamedTuple
+
+import orjson
+
+ROW_WIDTH = 7
+EMPTY_CELLS = ('',) * ROW_WIDTH
+UUID_PATTERN = re.compile(r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}')
+
+
+def to_id(cell: Any) -> str | None:
+    """Return the id in its canonical lowercase UUID form, or ``None`` when the cell is not a UUID."""
+    if isinstance(cell, str) and UUID_PATTERN.fullmatch(cell):
+        return cell.lower()
+
+    return None
+
+
+class MenuRow(NamedTuple):
+    id: str
+    title: str
+    description: str
+    digest: str
+
+
+class SubmenuRow(NamedTuple):
+    id: str
+    menu_id: str
+    title: str
+    description: str
+    digest: str
+
+
+class DishRow(NamedTuple):
+    id: str
+    menu_id: str
+    submenu_id: str
+    title: str
+    description: str
+    price: str
+    discount: int
+    digest: str
+
+
+class MalformedRow(NamedTuple):
+    number: int
+    row: list
+    reason: str
+
+
+class ParsedSheet(NamedTuple):
+    menus: list[MenuRow]
+    submenus: list[SubmenuRow]
+    dishes: list[DishRow]
+    dishes_index: dict[str, dict[str, int]]
+    errors: list[MalformedRow]
+
+    @property
+    def row_digests(self) -> dict[str, str]:
+        return {row.id: row.digest for rows in (self.menus, self.submenus, self.dishes) for row in rows}
+
+    @property
+    def malformed_ids(self) -> set[str]:
+        return {row_id for error in self.errors for row_id in map(to_id, error.row[:3]) if row_id}
+
+
 class GoogleSheetsParser:
 
-    async def parse_data(self, data: list[list]) -> list[dict]:
-        result = []
-        for i in data:
-            if i[0]:
-                menu = {
-                    'id': i[0],
-                    'title': i[1],
-                    'description': i[2],
-                    'submenus': [],
-                }
-                result.append(menu)
-            elif not i[0] and i[1]:
-                submenu = {
-                    'id': i[1],
-                    'title': i[2],
-                    'description': i[3],
-                    'dishes': []
-                }
-                result[-1]['submenus'].append(submenu)
-            elif not i[1] and i[2]:
-                dish = {
-                    'id': i[2],
-                    'title': i[3],
-                    'description': i[4],
-                    'price': i[5],
-                }
-                result[-1]['submenus'][-1]['dishes'].append(dish)
-
-        return result
-
-    async def parse_dish_data(self, data: list[list]) -> list[dict]:
-        result = []
-        for i in data:
-            if not i[1] and i[2]:
-                dish = {
-                    'id': i[2],
-                    'title': i[3],
-                    'description': i[4],
-                    'price': i[5],
-                    'discount': int(i[6]) if len(i) == 7 else 0
-                }
-                result.append(dish)
-
-        return result
+    async def parse(self, rows: Iterable[list]) -> ParsedSheet:
+        """Parse the rows in the default executor, so a large sheet does not block the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, self.parse_rows, rows)
+
+    def parse_rows(self, rows: Iterable[list]) -> ParsedSheet:
+        """Split the sheet into menus, submenus, dishes and their discounts in a single pass."""
+        parsed_sheet = ParsedSheet([], [], [], {'by_id': {}, 'by_title': {}}, [])
+        records: dict[type, list[Any]] = {
+            MenuRow: parsed_sheet.menus,
+            SubmenuRow: parsed_sheet.submenus,
+            DishRow: parsed_sheet.dishes,
+            MalformedRow: parsed_sheet.errors,
+        }
+        discounts_by_id = parsed_sheet.dishes_index['by_id']
+        discounts_by_title = parsed_sheet.dishes_index['by_title']
+
+        for record in self.iter_rows(rows):
+            records[type(record)].append(record)
+
+            if isinstance(record, DishRow):
+                if record.id not in discounts_by_id:
+                    discounts_by_id[record.id] = record.discount
+                if record.title not in discounts_by_title:
+                    discounts_by_title[record.title] = record.discount
+
+        return parsed_sheet
+
+    def iter_rows(self, rows: Iterable[list]) -> Iterator[MenuRow | SubmenuRow | DishRow | MalformedRow]:
+        """
+        Yield a record for every non-empty row.
+
+        A menu row starts with its id, a submenu row with one empty cell and a dish row
+        with two; cells are strings and ids are UUIDs. Rows that cannot be placed in the tree or have invalid
+        cells are yielded as ``MalformedRow`` instead of raising. The digest of a submenu
+        or dish row covers its parent id too, so moving it changes the digest.
+        """
+        get_row_digest = self._get_row_digest
+        is_id = UUID_PATTERN.fullmatch
+        menu_id = submenu_id = None
+
+        for number, row in enumerate(rows, start=1):
+            cells = row if len(row) >= ROW_WIDTH else [*row, *EMPTY_CELLS[len(row):]]
+
+            if cells[0]:
+                menu_id = cells[0].lower() if is_id(cells[0]) else None
+                submenu_id = None
+
+                if menu_id is None:
+                    yield MalformedRow(number, row, f'invalid menu id {cells[0]!r}')
+                    continue
+
+                yield MenuRow(menu_id, cells[1], cells[2], get_row_digest(row))
+
+            elif cells[1]:
+                if menu_id is None:
+                    yield MalformedRow(number, row, 'submenu row without a valid menu')
+                    continue
+
+                submenu_id = cells[1].lower() if is_id(cells[1]) else None
+
+                if submenu_id is None:
+                    yield MalformedRow(number, row, f'invalid submenu id {cells[1]!r}')
+                    continue
+
+                yield SubmenuRow(submenu_id, menu_id, cells[2], cells[3], get_row_digest((menu_id, row)))
+
+            elif cells[2]:
+                if menu_id is None or submenu_id is None:
+                    yield MalformedRow(number, row, 'dish row without a valid submenu')
+                    continue
+
+                dish_id = cells[2].lower() if is_id(cells[2]) else None
+
+                if dish_id is None:
+                    yield MalformedRow(number, row, f'invalid dish id {cells[2]!r}')
+                    continue
+
+                if not cells[5]:
+                    yield MalformedRow(number, row, 'dish row without price')
+                    continue
+
+                try:
+                    discount = int(cells[6]) if cells[6] else 0
+                except ValueError:
+                    yield MalformedRow(number, row, f'invalid discount {cells[6]!r}')
+                    continue
+
+                yield DishRow(dish_id, menu_id, submenu_id, cells[3], cells[4], cells[5], discount,
+                              get_row_digest((submenu_id, row)))
+
+    @staticmethod
+    def _get_row_digest(row: Any) -> str:
+        return hashlib.blake2b(orjson.dumps(row), digest_size=16).hexdigest()
+
+    async def get_digest(self, data: list[list]) -> str:
+        return hashlib.blake2b(orjson.dumps(data), digest_size=16).hexdigest()
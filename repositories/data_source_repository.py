@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+
+class DataSourceRepository(ABC):
+    """
+    Source of the menu sheet rows used by the sync and by the discounts.
+
+    Rows are lists of strings laid out as in the Google sheet: a menu row starts with
+    its id, a submenu row with one empty cell and a dish row with two.
+    """
+
+    @abstractmethod
+    async def get_data(self) -> list[list]:
+        ...
+
+    async def get_revision(self) -> str | None:
+        """Return a marker that changes whenever the data does, or ``None`` when the source cannot tell."""
+        return None
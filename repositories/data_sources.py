@@ -0,0 +1,13 @@
+from config import DATA_SOURCE
+from repositories.data_source_repository import DataSourceRepository
+from repositories.google_sheets_repository import GoogleSheetsRepository
+from repositories.local_file_repository import LocalFileRepository
+
+DATA_SOURCES: dict[str, type[DataSourceRepository]] = {
+    'google_sheets': GoogleSheetsRepository,
+    'local_file': LocalFileRepository,
+}
+
+
+def get_data_source() -> DataSourceRepository:
+    return DATA_SOURCES[DATA_SOURCE]()
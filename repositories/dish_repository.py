@@ -1,10 +1,12 @@
 import uuid
-from typing import Sequence
+from typing import Any, Iterable, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import Row, delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.exc import UnmappedInstanceError
 
+from config import SYNC_BATCH_SIZE
 from database.models import Dish
 from utils import schemas
 
@@ -37,6 +39,7 @@ class DishRepository:
         dish_obj.title = dish.title
         dish_obj.description = dish.description
         dish_obj.price = dish.price
+        dish_obj.source_hash = None
         await self.session.commit()
 
         return dish_obj
@@ -58,6 +61,30 @@ class DishRepository:
         )
         return res.scalars().all()
 
+    async def get_fingerprints(self) -> Sequence[Row[Any]]:
+        res = await self.session.execute(select(Dish.id, Dish.source_hash, Dish.submenu_id))
+
+        return res.fetchall()
+
+    async def upsert_many(self, dishes: list[dict[str, Any]]) -> None:
+        """Insert or update the given rows in batches without committing."""
+        for i in range(0, len(dishes), SYNC_BATCH_SIZE):
+            stmt = insert(Dish).values(dishes[i:i + SYNC_BATCH_SIZE])
+            await self.session.execute(stmt.on_conflict_do_update(index_elements=[Dish.id], set_={
+                'title': stmt.excluded.title,
+                'description': stmt.excluded.description,
+                'price': stmt.excluded.price,
+                'submenu_id': stmt.excluded.submenu_id,
+                'source_hash': stmt.excluded.source_hash,
+            }))
+
+    async def delete_many(self, ids: Iterable[str | uuid.UUID]) -> None:
+        """Delete the given rows in batches without committing."""
+        ids = list(ids)
+
+        for i in range(0, len(ids), SYNC_BATCH_SIZE):
+            await self.session.execute(delete(Dish).where(Dish.id.in_(ids[i:i + SYNC_BATCH_SIZE])))
+
     async def get_by_id(self, dish_id: uuid.UUID) -> Dish:
         res = await self.session.execute(
             select(Dish)
@@ -1,11 +1,88 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
 import gspread
 
+from config import (
+    GOOGLE_SHEETS_CREDENTIALS_FILE,
+    GOOGLE_SHEETS_MAX_WORKERS,
+    GOOGLE_SHEETS_SPREADSHEET_KEY,
+    GOOGLE_SHEETS_SPREADSHEET_NAME,
+    GOOGLE_SHEETS_TIMEOUT,
+)
+from repositories.data_source_repository import DataSourceRepository
+from utils.metrics import GOOGLE_SHEETS_LATENCY
+
+T = TypeVar('T')
+
+executor = ThreadPoolExecutor(max_workers=GOOGLE_SHEETS_MAX_WORKERS, thread_name_prefix='google_sheets')
+
+worksheet: gspread.Worksheet | None = None
+worksheet_lock = threading.Lock()
+
 
-class GoogleSheetsRepository:
+class GoogleSheetsRepository(DataSourceRepository):
     async def get_data(self) -> list[list]:
-        creds = gspread.service_account(filename='admin/swift-adviser-413809-eab9b0b5a6ca.json')
-        sheet = creds .open('Menu').sheet1
+        """
+        Fetch the sheet rows without blocking the event loop.
+
+        gspread is synchronous, so the fetch runs in a small dedicated thread pool and
+        raises ``asyncio.TimeoutError`` after ``GOOGLE_SHEETS_TIMEOUT`` seconds. The HTTP
+        requests share the same timeout, so a stuck fetch frees its thread as well.
+        """
+        with GOOGLE_SHEETS_LATENCY.time():
+            return await self._run_in_executor(self._fetch_data)
+
+    async def get_revision(self) -> str | None:
+        """Return the spreadsheet modification time reported by Drive, a cheap call compared to ``get_data``."""
+        return await self._run_in_executor(self._fetch_revision)
+
+    async def _run_in_executor(self, func: Callable[[], T]) -> T:
+        loop = asyncio.get_running_loop()
+
+        return await asyncio.wait_for(loop.run_in_executor(executor, func), timeout=GOOGLE_SHEETS_TIMEOUT)
+
+    def _fetch_data(self) -> list[list]:
+        try:
+            return self._get_worksheet().get()
+        except gspread.exceptions.GSpreadException:
+            self._reset_worksheet()
+            raise
+
+    def _fetch_revision(self) -> str | None:
+        try:
+            return self._get_worksheet().spreadsheet.get_lastUpdateTime()
+        except gspread.exceptions.GSpreadException:
+            self._reset_worksheet()
+            raise
+
+    def _get_worksheet(self) -> gspread.Worksheet:
+        """
+        Return the worksheet handle shared by every fetch in the process.
+
+        The client authenticates once and refreshes its access token by itself,
+        the spreadsheet is opened by key, or by name when no key is configured.
+        """
+        global worksheet
+
+        with worksheet_lock:
+            if worksheet is None:
+                client = gspread.service_account(filename=GOOGLE_SHEETS_CREDENTIALS_FILE)
+                client.http_client.set_timeout(GOOGLE_SHEETS_TIMEOUT)
+
+                if GOOGLE_SHEETS_SPREADSHEET_KEY:
+                    spreadsheet = client.open_by_key(GOOGLE_SHEETS_SPREADSHEET_KEY)
+                else:
+                    spreadsheet = client.open(GOOGLE_SHEETS_SPREADSHEET_NAME)
+
+                worksheet = spreadsheet.sheet1
+
+            return worksheet
 
-        data = sheet .get()
+    def _reset_worksheet(self) -> None:
+        global worksheet
 
-        return data
+        with worksheet_lock:
+            worksheet = None
@@ -0,0 +1,39 @@
+from typing import Any
+
+from cachetools import TTLCache
+
+from config import LOCAL_CACHE_MAXSIZE, LOCAL_CACHE_TTL
+
+
+class LocalCacheRepository:
+    """
+    Process-wide in-memory cache kept in front of Redis.
+
+    Entries are evicted by TTL and, once the cache is full, least recently used first.
+    It stays disabled until the process is subscribed to cache invalidations,
+    otherwise writes made by other processes could be served stale.
+    """
+
+    cache: TTLCache = TTLCache(maxsize=LOCAL_CACHE_MAXSIZE, ttl=LOCAL_CACHE_TTL)
+    enabled = False
+
+    async def get(self, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+
+        return self.cache.get(key)
+
+    async def set(self, key: str, value: Any) -> None:
+        if self.enabled:
+            self.cache[key] = value
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.cache.pop(key, None)
+
+    async def enable(self) -> None:
+        type(self).enabled = True
+
+    async def disable(self) -> None:
+        type(self).enabled = False
+        self.cache.clear()
@@ -0,0 +1,63 @@
+import asyncio
+import csv
+import os
+from typing import Any, Iterable
+
+import openpyxl
+
+from config import DATA_SOURCE_FILE
+from repositories.data_source_repository import DataSourceRepository
+
+files_data: dict[str, tuple[int, list[list]]] = {}
+
+
+class LocalFileRepository(DataSourceRepository):
+    """Reads the menu from a local XLSX or CSV file, rereading it only when its mtime changes."""
+
+    def __init__(self, path: str = DATA_SOURCE_FILE):
+        self.path = path
+
+    async def get_data(self) -> list[list]:
+        mtime = os.stat(self.path).st_mtime_ns
+        cached = files_data.get(self.path)
+
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        data = await asyncio.get_running_loop().run_in_executor(None, self._read_rows)
+        files_data[self.path] = (mtime, data)
+
+        return data
+
+    async def get_revision(self) -> str | None:
+        return str(os.stat(self.path).st_mtime_ns)
+
+    def _read_rows(self) -> list[list]:
+        if self.path.endswith('.csv'):
+            with open(self.path, newline='', encoding='utf-8') as file:
+                return self._normalize_rows(csv.reader(file))
+
+        workbook = openpyxl.load_workbook(self.path, read_only=True, data_only=True)
+
+        try:
+            return self._normalize_rows(workbook.active.iter_rows(values_only=True))
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _normalize_rows(rows: Iterable[Iterable[Any]]) -> list[list]:
+        """Convert cells to strings and drop trailing empty cells and empty rows, as the Sheets API does."""
+        result = []
+        for row in rows:
+            cells = [
+                '' if value is None else str(int(value)) if isinstance(value, float) and value.is_integer()
+                else str(value)
+                for value in row
+            ]
+            while cells and not cells[-1]:
+                cells.pop()
+
+            if cells:
+                result.append(cells)
+
+        return result
@@ -1,12 +1,14 @@
 import uuid
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
-from sqlalchemy import Row, func, select
+from sqlalchemy import Row, delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from sqlalchemy.orm.exc import UnmappedInstanceError
 
-from database.models import Dish, Menu, Submenu
+from config import SYNC_BATCH_SIZE
+from database.models import Menu, Submenu
 from utils import schemas
 
 
@@ -32,6 +34,7 @@ class MenuRepository:
 
         menu_obj.title = menu.title
         menu_obj.description = menu.description
+        menu_obj.source_hash = None
         await self.session.commit()
 
         return await self.get_by_id_with_counts(menu_obj.id)
@@ -48,18 +51,39 @@ class MenuRepository:
 
     async def get(self) -> Sequence[Row[Any]]:
         res = await self.session.execute(
-            select(
-                Menu,
-                func.count(func.distinct(Submenu.id)).label('submenus_count'),
-                func.count(func.distinct(Dish.id)).label('dishes_count')
-            )
-            .outerjoin(Submenu, Menu.id == Submenu.menu_id)
-            .outerjoin(Dish, Submenu.id == Dish.submenu_id)
-            .group_by(Menu.id, Menu.title, Menu.description)
+            select(Menu, Menu.submenus_count, Menu.dishes_count)
+            .execution_options(populate_existing=True)
         )
 
         return res.fetchall()
 
+    async def get_ids(self) -> Sequence[uuid.UUID]:
+        res = await self.session.execute(select(Menu.id))
+
+        return res.scalars().all()
+
+    async def get_fingerprints(self) -> Sequence[Row[Any]]:
+        res = await self.session.execute(select(Menu.id, Menu.source_hash))
+
+        return res.fetchall()
+
+    async def upsert_many(self, menus: list[dict[str, Any]]) -> None:
+        """Insert or update the given rows in batches without committing."""
+        for i in range(0, len(menus), SYNC_BATCH_SIZE):
+            stmt = insert(Menu).values(menus[i:i + SYNC_BATCH_SIZE])
+            await self.session.execute(stmt.on_conflict_do_update(index_elements=[Menu.id], set_={
+                'title': stmt.excluded.title,
+                'description': stmt.excluded.description,
+                'source_hash': stmt.excluded.source_hash,
+            }))
+
+    async def delete_many(self, ids: Iterable[str | uuid.UUID]) -> None:
+        """Delete the given rows in batches without committing."""
+        ids = list(ids)
+
+        for i in range(0, len(ids), SYNC_BATCH_SIZE):
+            await self.session.execute(delete(Menu).where(Menu.id.in_(ids[i:i + SYNC_BATCH_SIZE])))
+
     async def get_by_id(self, menu_id: uuid.UUID) -> Menu:
         res = await self.session.execute(
             select(Menu)
@@ -78,15 +102,9 @@ class MenuRepository:
 
     async def get_by_id_with_counts(self, menu_id: uuid.UUID) -> Row[Any]:
         res = await self.session.execute(
-            select(
-                Menu,
-                func.count(func.distinct(Submenu.id)).label('submenus_count'),
-                func.count(func.distinct(Dish.id)).label('dishes_count')
-            )
-            .outerjoin(Submenu, Menu.id == Submenu.menu_id)
-            .outerjoin(Dish, Submenu.id == Dish.submenu_id)
+            select(Menu, Menu.submenus_count, Menu.dishes_count)
             .where(Menu.id == menu_id)
-            .group_by(Menu.id, Menu.title, Menu.description)
+            .execution_options(populate_existing=True)
         )
 
         return res.fetchone()
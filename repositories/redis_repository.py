@@ -1,50 +1,403 @@
-import pickle
-from typing import Any
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import asynccontextmanager, suppress
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    NamedTuple,
+    Sequence,
+)
 
-import aioredis
+import orjson
+from aioredis import RedisError
 
+from config import (
+    CACHE_CODEC,
+    CACHE_INVALIDATION_CHANNEL,
+    CACHE_LOCK_TIMEOUT,
+    CACHE_LOCK_WAIT,
+    CACHE_STALE_AFTER,
+    CACHE_TTL,
+    LOCAL_CACHE_ENABLED,
+)
 from converters.redis_converter import RedisConverter
+from database.redis_pool import get_redis
+from repositories.local_cache_repository import LocalCacheRepository
+from utils.metrics import (
+    CACHE_HITS,
+    CACHE_INVALIDATED_KEYS,
+    CACHE_INVALIDATION_SIZE,
+    CACHE_INVALIDATIONS,
+    CACHE_MISSES,
+    CACHE_SETS,
+    REDIS_LATENCY,
+)
+from utils.serializers import CachedValue, CacheSerializer
+
+MENUS_LISTS_KEYS = ('menus_list', 'menus_list_with_submenus_and_dishes')
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+EXTEND_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+logger = logging.getLogger(__name__)
+
+in_flight_builds: dict[str, asyncio.Future] = {}
+refresh_tasks: dict[str, asyncio.Task] = {}
+
+
+class CacheEntry(NamedTuple):
+    keys: Sequence[Any]
+    value: Any
+    tags: Iterable[Any] = ()
 
 
 class RedisRepository:
     def __init__(self):
-        self.redis = aioredis.from_url('redis://redis_ylab')
+        self.redis = get_redis()
         self.converter = RedisConverter()
+        self.serializer = CacheSerializer(CACHE_CODEC)
+        self.local_cache = LocalCacheRepository()
+        self.release_lock_script = self.redis.register_script(RELEASE_LOCK_SCRIPT)
+        self.extend_lock_script = self.redis.register_script(EXTEND_LOCK_SCRIPT)
 
-    async def save(self, *keys: Any, value: Any, ex: int = 300) -> None:
-        key = await self.converter.generate_key(*keys)
+    async def save(self, *keys: Any, value: Any, ex: int = CACHE_TTL, stale_after: int | None = None,
+                   tags: Iterable[Any] = ()) -> None:
+        await self.save_many([CacheEntry(keys, value, tags)], ex=ex, stale_after=stale_after)
+
+    async def save_many(self, entries: Iterable[CacheEntry], ex: int = CACHE_TTL,
+                        stale_after: int | None = None) -> None:
+        """
+        Write all entries and their tag registrations in a single pipelined round-trip.
+
+        Entries expire after ``ex`` seconds and are considered stale after ``stale_after``.
+        Overwritten keys are broadcast so other processes drop their local copies.
+        """
+        stale_at = time.time() + (stale_after if stale_after is not None else ex)
+        saved_values = {}
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for entry in entries:
+                key = await self.converter.generate_key(*entry.keys)
+                pipe.set(key, self.serializer.dumps(entry.value, stale_at), ex=ex)
+                saved_values[key] = CachedValue(entry.value, stale_at)
+                CACHE_SETS.labels(await self.converter.generate_family(key)).inc()
 
-        value = pickle.dumps(value)
-        await self.redis.set(key, value, ex=ex)
+                for tag in entry.tags:
+                    tag_key = await self.converter.generate_tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    pipe.expire(tag_key, ex)
+
+            if saved_values:
+                pipe.publish(CACHE_INVALIDATION_CHANNEL, orjson.dumps(sorted(saved_values)))
+
+            with REDIS_LATENCY.labels('save').time():
+                await pipe.execute()
+
+        for key, cached in saved_values.items():
+            await self.local_cache.set(key, cached)
 
     async def get(self, *keys: Any) -> Any | None:
         key = await self.converter.generate_key(*keys)
-        value = await self.redis.get(key)
+        cached = await self._get_cached(key)
+
+        return cached.value if cached is not None else None
+
+    async def _get_cached(self, key: str) -> CachedValue | None:
+        family = await self.converter.generate_family(key)
+        cached = await self.local_cache.get(key)
 
-        if not value:
+        if cached is not None:
+            CACHE_HITS.labels(family, 'local').inc()
+            return cached
+
+        with REDIS_LATENCY.labels('get').time():
+            payload = await self.redis.get(key)
+
+        cached = self.serializer.loads(payload) if payload else None
+
+        if cached is None:
+            CACHE_MISSES.labels(family).inc()
             return None
 
-        value = pickle.loads(value)
+        CACHE_HITS.labels(family, 'redis').inc()
+        await self.local_cache.set(key, cached)
+
+        return cached
+
+    async def get_or_set(self, *keys: Any, builder: Callable[[], Awaitable[Any]],
+                         refresh: Callable[[], Awaitable[Any]] | None = None, ex: int = CACHE_TTL,
+                         stale_after: int = CACHE_STALE_AFTER, tags: Iterable[Any] = ()) -> Any:
+        """
+        Return the cached value or build it, letting only one caller rebuild a missing key.
+
+        Concurrent misses in this process await the same build, other processes
+        wait for the value while the rebuilding one holds a short Redis lock.
+        A stale value is returned as is while ``refresh`` rebuilds it in the background.
+        """
+        key = await self.converter.generate_key(*keys)
+        cached = await self._get_cached(key)
+
+        if cached is not None:
+            if refresh is not None and cached.stale_at <= time.time():
+                self._schedule_refresh(key, keys, refresh, ex, stale_after, tags)
+
+            return cached.value
+
+        in_flight = in_flight_builds.get(key)
+
+        if in_flight is not None:
+            await asyncio.wait({in_flight})
+
+            if not in_flight.cancelled():
+                return in_flight.result()
+
+        future = asyncio.get_running_loop().create_future()
+        in_flight_builds[key] = future
+
+        try:
+            value = await self._build_once(key, keys, builder, ex, stale_after, tags)
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            if in_flight_builds.get(key) is future:
+                del in_flight_builds[key]
+
         return value
 
-    async def delete_parents_and_children_keys(self, key: Any) -> None:
-        keys = await self.get_all_parents_and_children_keys(key)
+    async def _build_once(self, key: str, keys: Sequence[Any], builder: Callable[[], Awaitable[Any]], ex: int,
+                          stale_after: int, tags: Iterable[Any]) -> Any:
+        lock_key = f'lock_{key}'
+        token: str | None = uuid.uuid4().hex
 
-        for key in keys:
-            await self.redis.delete(key)
+        if not await self.redis.set(lock_key, token, nx=True, ex=CACHE_LOCK_TIMEOUT):
+            deadline = time.monotonic() + CACHE_LOCK_WAIT
 
-    async def delete(self, *keys: Any) -> None:
-        for key in keys:
-            await self.redis.delete(str(key))
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                value = await self.get(*keys)
+
+                if value is not None:
+                    return value
+
+            token = None
+
+        try:
+            value = await self.get(*keys)
+
+            if value is None:
+                value = await builder()
+                await self.save(*keys, value=value, ex=ex, stale_after=stale_after, tags=tags)
+
+            return value
+        finally:
+            if token is not None:
+                await self.release_lock_script(keys=[lock_key], args=[token])
+
+    def _schedule_refresh(self, key: str, keys: Sequence[Any], refresh: Callable[[], Awaitable[Any]], ex: int,
+                          stale_after: int, tags: Iterable[Any]) -> None:
+        if key in refresh_tasks:
+            return
+
+        task = asyncio.create_task(self._refresh(key, keys, refresh, ex, stale_after, tags))
+        refresh_tasks[key] = task
+        task.add_done_callback(lambda _: refresh_tasks.pop(key, None))
+
+    async def _refresh(self, key: str, keys: Sequence[Any], refresh: Callable[[], Awaitable[Any]], ex: int,
+                       stale_after: int, tags: Iterable[Any]) -> None:
+        lock_key = f'lock_{key}'
+        token = uuid.uuid4().hex
 
-    async def get_all_parents_and_children_keys(self, key: Any) -> list[str]:
-        keys = ['menus_list', 'submenus_list', 'dishes_list', 'menus_list_with_submenus_and_dishes',
-                'data_from_google_sheet', 'dishes_data_from_google_sheet']
-        matching_keys = []
-        cursor = b'0'
+        if not await self.redis.set(lock_key, token, nx=True, ex=CACHE_LOCK_TIMEOUT):
+            return
 
-        while cursor:
-            cursor, keys_batch = await self.redis.scan(cursor, match=f'{key}*')
-            matching_keys.extend(keys_batch)
+        try:
+            value = await refresh()
+            await self.save(*keys, value=value, ex=ex, stale_after=stale_after, tags=tags)
+        except Exception:
+            logger.exception('Failed to refresh cache key %s', key)
+        finally:
+            await self.release_lock_script(keys=[lock_key], args=[token])
 
-        return matching_keys + keys
+    @asynccontextmanager
+    async def lease(self, name: str, ttl: int) -> AsyncIterator[bool]:
+        """
+        Hold the cluster-wide lock ``name`` for the duration of the block.
+
+        Yields whether the lock was acquired. While it is held a heartbeat extends it
+        every third of ``ttl`` seconds, so it only expires if the holder dies.
+        """
+        lock_key = f'lock_{name}'
+        token = uuid.uuid4().hex
+
+        if not await self.redis.set(lock_key, token, nx=True, ex=ttl):
+            yield False
+            return
+
+        heartbeat = asyncio.create_task(self._extend_lease(lock_key, token, ttl))
+
+        try:
+            yield True
+        finally:
+            heartbeat.cancel()
+            with suppress(asyncio.CancelledError):
+                await heartbeat
+            await self.release_lock_script(keys=[lock_key], args=[token])
+
+    async def _extend_lease(self, lock_key: str, token: str, ttl: int) -> None:
+        while True:
+            await asyncio.sleep(ttl / 3)
+
+            if not await self.extend_lock_script(keys=[lock_key], args=[token, ttl * 1000]):
+                logger.warning('Lost lock %s', lock_key)
+                return
+
+    async def set_flag(self, *keys: Any, ex: int = CACHE_TTL, nx: bool = False) -> bool:
+        return bool(await self.redis.set(await self.converter.generate_key(*keys), 1, ex=ex, nx=nx))
+
+    async def has_flag(self, *keys: Any) -> bool:
+        return bool(await self.redis.exists(await self.converter.generate_key(*keys)))
+
+    async def pop_flag(self, *keys: Any) -> bool:
+        return bool(await self.redis.delete(await self.converter.generate_key(*keys)))
+
+    async def incr(self, *keys: Any) -> int:
+        return await self.redis.incr(await self.converter.generate_key(*keys))
+
+    async def get_counter(self, *keys: Any) -> int:
+        return int(await self.redis.get(await self.converter.generate_key(*keys)) or 0)
+
+    async def mget(self, *keys: Sequence[Any]) -> list[Any | None]:
+        redis_keys = [await self.converter.generate_key(*key) for key in keys]
+        cached_values = [await self.local_cache.get(key) for key in redis_keys]
+        missing_keys = [key for key, cached in zip(redis_keys, cached_values) if cached is None]
+
+        if missing_keys:
+            with REDIS_LATENCY.labels('mget').time():
+                payloads = dict(zip(missing_keys, await self.redis.mget(missing_keys)))
+
+            for i, key in enumerate(redis_keys):
+                family = await self.converter.generate_family(key)
+
+                if key not in payloads:
+                    CACHE_HITS.labels(family, 'local').inc()
+                    continue
+
+                cached_values[i] = self.serializer.loads(payloads[key]) if payloads[key] else None
+
+                if cached_values[i] is None:
+                    CACHE_MISSES.labels(family).inc()
+                    continue
+
+                CACHE_HITS.labels(family, 'redis').inc()
+                await self.local_cache.set(key, cached_values[i])
+
+        return [cached.value if cached is not None else None for cached in cached_values]
+
+    async def invalidate(self, *keys: Any, tags: Iterable[Any] = ()) -> None:
+        """Delete the given keys together with every key saved under one of the tags."""
+        keys_to_delete = {str(key) for key in keys}
+        tag_keys = [await self.converter.generate_tag_key(tag) for tag in tags]
+
+        if tag_keys:
+            with REDIS_LATENCY.labels('sunion').time():
+                tagged_keys = await self.redis.sunion(*tag_keys)
+            keys_to_delete.update(key.decode() for key in tagged_keys)
+            keys_to_delete.update(tag_keys)
+
+        await self.unlink(*keys_to_delete)
+
+    async def invalidate_menu(self, menu_id: Any) -> None:
+        await self.invalidate_scopes(menu_ids=(menu_id,))
+
+    async def invalidate_submenu(self, menu_id: Any, submenu_id: Any) -> None:
+        await self.invalidate_scopes(submenus=((menu_id, submenu_id),))
+
+    async def invalidate_scopes(self, menu_ids: Iterable[Any] = (),
+                                submenus: Iterable[tuple[Any, Any]] = ()) -> None:
+        """
+        Invalidate several menus and ``(menu_id, submenu_id)`` pairs in one deduplicated pass.
+
+        The menus lists are dropped once, together with every key tagged by a menu or
+        a submenu and with the menu keys of each submenu's parent.
+        """
+        tags = set(menu_ids)
+        keys = set()
+
+        for menu_id, submenu_id in submenus:
+            tags.add(submenu_id)
+            keys.add(await self.converter.generate_key(menu_id))
+            keys.add(await self.converter.generate_key(menu_id, 'submenus_list'))
+
+        if not tags:
+            return
+
+        await self.invalidate(*MENUS_LISTS_KEYS, *keys, tags=tags)
+
+    async def unlink(self, *keys: Any) -> None:
+        """Delete keys from Redis and from the local caches of every process."""
+        if not keys:
+            return
+
+        redis_keys = sorted({str(key) for key in keys})
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.unlink(*redis_keys)
+            pipe.publish(CACHE_INVALIDATION_CHANNEL, orjson.dumps(redis_keys))
+
+            with REDIS_LATENCY.labels('unlink').time():
+                await pipe.execute()
+
+        await self.local_cache.delete(*redis_keys)
+
+    async def listen_for_invalidations(self) -> None:
+        """
+        Evict local cache entries invalidated by any process until the task is cancelled.
+
+        The local cache is only enabled while the subscription is alive.
+        """
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+
+                    async for message in pubsub.listen():
+                        if message['type'] == 'subscribe' and LOCAL_CACHE_ENABLED:
+                            await self.local_cache.enable()
+                        elif message['type'] == 'message':
+                            await self._evict_invalidated(orjson.loads(message['data']))
+            except (RedisError, OSError):
+                await asyncio.sleep(1)
+            finally:
+                await self.local_cache.disable()
+
+    async def _evict_invalidated(self, keys: list[str]) -> None:
+        await self.local_cache.delete(*keys)
+
+        CACHE_INVALIDATIONS.inc()
+        CACHE_INVALIDATION_SIZE.observe(len(keys))
+
+        for key in keys:
+            CACHE_INVALIDATED_KEYS.labels(await self.converter.generate_family(key)).inc()
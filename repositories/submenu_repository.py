@@ -1,11 +1,13 @@
 import uuid
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
-from sqlalchemy import Row, func, select
+from sqlalchemy import Row, delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm.exc import UnmappedInstanceError
 
-from database.models import Dish, Submenu
+from config import SYNC_BATCH_SIZE
+from database.models import Submenu
 from utils import schemas
 
 
@@ -36,6 +38,7 @@ class SubmenuRepository:
 
         submenu_obj.title = submenu.title
         submenu_obj.description = submenu.description
+        submenu_obj.source_hash = None
         await self.session.commit()
 
         return await self.get_by_id_with_counts(submenu_obj.id)
@@ -52,17 +55,41 @@ class SubmenuRepository:
 
     async def get(self, menu_id: uuid.UUID) -> Sequence[Row[Any]]:
         res = await self.session.execute(
-            select(
-                Submenu,
-                func.count(func.distinct(Dish.id)).label('dishes_count')
-            )
-            .outerjoin(Dish, Submenu.id == Dish.submenu_id)
+            select(Submenu, Submenu.dishes_count)
             .where(Submenu.menu_id == menu_id)
-            .group_by(Submenu.id, Submenu.title, Submenu.description)
+            .execution_options(populate_existing=True)
         )
 
         return res.fetchall()
 
+    async def get_ids(self) -> Sequence[Row[Any]]:
+        res = await self.session.execute(select(Submenu.menu_id, Submenu.id))
+
+        return res.fetchall()
+
+    async def get_fingerprints(self) -> Sequence[Row[Any]]:
+        res = await self.session.execute(select(Submenu.id, Submenu.source_hash, Submenu.menu_id))
+
+        return res.fetchall()
+
+    async def upsert_many(self, submenus: list[dict[str, Any]]) -> None:
+        """Insert or update the given rows in batches without committing."""
+        for i in range(0, len(submenus), SYNC_BATCH_SIZE):
+            stmt = insert(Submenu).values(submenus[i:i + SYNC_BATCH_SIZE])
+            await self.session.execute(stmt.on_conflict_do_update(index_elements=[Submenu.id], set_={
+                'title': stmt.excluded.title,
+                'description': stmt.excluded.description,
+                'menu_id': stmt.excluded.menu_id,
+                'source_hash': stmt.excluded.source_hash,
+            }))
+
+    async def delete_many(self, ids: Iterable[str | uuid.UUID]) -> None:
+        """Delete the given rows in batches without committing."""
+        ids = list(ids)
+
+        for i in range(0, len(ids), SYNC_BATCH_SIZE):
+            await self.session.execute(delete(Submenu).where(Submenu.id.in_(ids[i:i + SYNC_BATCH_SIZE])))
+
     async def get_by_id(self, submenu_id: uuid.UUID) -> Submenu:
         res = await self.session.execute(
             select(Submenu)
@@ -81,13 +108,9 @@ class SubmenuRepository:
 
     async def get_by_id_with_counts(self, submenu_id: uuid.UUID) -> Row[Any]:
         res = await self.session.execute(
-            select(
-                Submenu,
-                func.count(func.distinct(Dish.id)).label('dishes_count')
-            )
-            .outerjoin(Dish, Submenu.id == Dish.submenu_id)
+            select(Submenu, Submenu.dishes_count)
             .where(Submenu.id == submenu_id)
-            .group_by(Submenu.id, Submenu.title, Submenu.description)
+            .execution_options(populate_existing=True)
         )
 
         return res.fetchone()
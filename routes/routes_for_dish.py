@@ -1,13 +1,13 @@
-from typing import Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.database import get_async_session
 from database.models import Dish
 from services.dish_service import DishService
 from utils import schemas
+from utils.responses import cached_json_response
 
 dishes_router = APIRouter(prefix='/menus', tags=['Dish'])
 
@@ -17,9 +17,9 @@ dishes_router = APIRouter(prefix='/menus', tags=['Dish'])
     response_model=list[schemas.DishOut],
 )
 async def get_list_dishes(
-        menu_id: UUID, submenu_id: UUID, session: AsyncSession = Depends(get_async_session)
-) -> Sequence[Dish]:
-    return await DishService(session).get(submenu_id)
+        menu_id: UUID, submenu_id: UUID, request: Request, session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    return cached_json_response(request, await DishService(session).get(menu_id, submenu_id))
 
 
 @dishes_router.get(
@@ -28,9 +28,9 @@ async def get_list_dishes(
     responses={404: {'model': schemas.NotFoundError}}
 )
 async def get_dish_by_id(
-        menu_id: UUID, submenu_id: UUID, dish_id: UUID, session: AsyncSession = Depends(get_async_session)
-) -> Dish:
-    return await DishService(session).get_by_id(menu_id, submenu_id, dish_id)
+        menu_id: UUID, submenu_id: UUID, dish_id: UUID, request: Request, session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    return cached_json_response(request, await DishService(session).get_by_id(menu_id, submenu_id, dish_id))
 
 
 @dishes_router.post(
@@ -60,12 +60,12 @@ async def update_dish_by_id(
         submenu_id: UUID,
         dish_id: UUID,
         session: AsyncSession = Depends(get_async_session),
-) -> Dish:
-    return await DishService(session).update(background_tasks, dish, menu_id, dish_id)
+) -> schemas.DishOut:
+    return await DishService(session).update(background_tasks, dish, menu_id, submenu_id, dish_id)
 
 
 @dishes_router.delete('/{menu_id}/submenus/{submenu_id}/dishes/{dish_id}', response_model=schemas.OutAfterDelete, responses={404: {'model': schemas.NotFoundError}})
 async def delete_dish_by_id(
         menu_id: UUID, background_tasks: BackgroundTasks, submenu_id: UUID, dish_id: UUID, session: AsyncSession = Depends(get_async_session)
 ) -> schemas.OutAfterDelete:
-    return await DishService(session).delete(background_tasks, menu_id, dish_id)
+    return await DishService(session).delete(background_tasks, menu_id, submenu_id, dish_id)
@@ -1,28 +1,29 @@
 import uuid
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.database import get_async_session
 from services.menu_service import MenuService
 from utils import schemas
+from utils.responses import cached_json_response
 
 menus_router = APIRouter(prefix='/menus', tags=['Menu'])
 
 
 @menus_router.get('/', response_model=list[schemas.MenuOut])
-async def get_list_menus(session: AsyncSession = Depends(get_async_session)) -> list[schemas.MenuOut]:
-    return await MenuService(session).get()
+async def get_list_menus(request: Request, session: AsyncSession = Depends(get_async_session)) -> Response:
+    return cached_json_response(request, await MenuService(session).get())
 
 
 @menus_router.get('/all', response_model=list[schemas.MenuOutWithSubmenusAndDishes])
-async def get_list_menus_with_submenus_and_dishes(session: AsyncSession = Depends(get_async_session)) -> list[schemas.MenuOutWithSubmenusAndDishes]:
-    return await MenuService(session).get_menus_with_submenus_and_dishes()
+async def get_list_menus_with_submenus_and_dishes(request: Request, session: AsyncSession = Depends(get_async_session)) -> Response:
+    return cached_json_response(request, await MenuService(session).get_menus_with_submenus_and_dishes())
 
 
 @menus_router.get('/{menu_id}', response_model=schemas.MenuOut, responses={404: {'model': schemas.NotFoundError}})
-async def get_menu_by_id(menu_id: uuid.UUID, session: AsyncSession = Depends(get_async_session)) -> schemas.MenuOut:
-    return await MenuService(session).get_by_id(menu_id)
+async def get_menu_by_id(menu_id: uuid.UUID, request: Request, session: AsyncSession = Depends(get_async_session)) -> Response:
+    return cached_json_response(request, await MenuService(session).get_by_id(menu_id))
 
 
 @menus_router.post(
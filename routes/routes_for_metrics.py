@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+from services.sync_service import SyncService
+from utils.metrics import SYNC_SKIPPED_RUNS
+
+metrics_router = APIRouter(tags=['Metrics'])
+
+
+@metrics_router.get('/metrics', include_in_schema=False)
+async def get_metrics() -> Response:
+    SYNC_SKIPPED_RUNS.set(await SyncService().get_skipped_runs())
+
+    return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
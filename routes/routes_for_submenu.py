@@ -1,11 +1,12 @@
 import uuid
 
-from fastapi import APIRouter, BackgroundTasks, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.database import get_async_session
 from services.submenu_service import SubmenuService
 from utils import schemas
+from utils.responses import cached_json_response
 
 submenus_router = APIRouter(prefix='/menus', tags=['Submenu'])
 
@@ -14,9 +15,9 @@ submenus_router = APIRouter(prefix='/menus', tags=['Submenu'])
     '/{menu_id}/submenus', response_model=list[schemas.SubmenuOut]
 )
 async def get_list_submenus(
-        menu_id: uuid.UUID, session: AsyncSession = Depends(get_async_session)
-) -> list[schemas.SubmenuOut]:
-    return await SubmenuService(session).get(menu_id)
+        menu_id: uuid.UUID, request: Request, session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    return cached_json_response(request, await SubmenuService(session).get(menu_id))
 
 
 @submenus_router.get(
@@ -25,9 +26,9 @@ async def get_list_submenus(
     responses={404: {'model': schemas.NotFoundError}}
 )
 async def get_submenu_by_id(
-        menu_id: uuid.UUID, submenu_id: uuid.UUID, session: AsyncSession = Depends(get_async_session)
-) -> schemas.SubmenuOut:
-    return await SubmenuService(session).get_by_id(menu_id, submenu_id)
+        menu_id: uuid.UUID, submenu_id: uuid.UUID, request: Request, session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    return cached_json_response(request, await SubmenuService(session).get_by_id(menu_id, submenu_id))
 
 
 @submenus_router.post(
@@ -0,0 +1,33 @@
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from starlette.concurrency import run_in_threadpool
+
+from celery_conf import check_google_sheets
+from config import SYNC_API_TOKEN, SYNC_TRIGGER_DEBOUNCE
+from services.sync_service import SyncService
+from utils import schemas
+
+sync_router = APIRouter(prefix='/sync', tags=['Sync'])
+
+
+async def verify_sync_token(x_sync_token: str = Header(default='')) -> None:
+    if not SYNC_API_TOKEN or not secrets.compare_digest(x_sync_token.encode(), SYNC_API_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail='invalid sync token')
+
+
+@sync_router.post(
+    '',
+    response_model=schemas.SyncOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[Depends(verify_sync_token)],
+    responses={401: {'model': schemas.UnauthorizedError}},
+)
+async def trigger_sync() -> schemas.SyncOut:
+    if not await SyncService().request_run():
+        return schemas.SyncOut(status=False, message='sync is already scheduled')
+
+    # Publishing to the broker blocks and retries while it is unreachable.
+    await run_in_threadpool(check_google_sheets.apply_async, kwargs={'force': True}, countdown=SYNC_TRIGGER_DEBOUNCE)
+
+    return schemas.SyncOut(status=True, message='sync is scheduled')
@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import CACHE_STALE_AFTER, CACHE_TTL, CACHE_WARMUP_CONCURRENCY
+from database.database import run_in_new_session
+from repositories.menu_repository import MenuRepository
+from repositories.redis_repository import CacheEntry, RedisRepository
+from repositories.submenu_repository import SubmenuRepository
+from services.dish_service import DishService
+from services.menu_service import MenuService
+from services.submenu_service import SubmenuService
+
+
+class CacheWarmupService:
+    """
+    Precomputes the menus, submenus and dishes lists and stores them in one pipelined write.
+
+    Every entry is built in its own session and at most ``concurrency`` builds run at once.
+    """
+
+    def __init__(self, concurrency: int = CACHE_WARMUP_CONCURRENCY):
+        self.redis = RedisRepository()
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+    async def warm_up(self, menu_ids: Iterable[Any] | None = None,
+                      submenu_ids: Iterable[tuple[Any, Any]] | None = None) -> int:
+        """
+        Build the menus lists, the submenus lists of ``menu_ids`` and the dishes lists of
+        the ``(menu_id, submenu_id)`` pairs in ``submenu_ids``; every menu and submenu when
+        neither is given.
+        """
+        if menu_ids is None and submenu_ids is None:
+            menu_ids, submenu_ids = await run_in_new_session(self._get_ids)
+
+        jobs: list[Callable[[AsyncSession], Awaitable[list[CacheEntry]]]] = [
+            lambda session: MenuService(session).build_lists_cache_entries()
+        ]
+        jobs.extend(self._submenus_list_job(menu_id) for menu_id in menu_ids or ())
+        jobs.extend(self._dishes_list_job(menu_id, submenu_id) for menu_id, submenu_id in submenu_ids or ())
+
+        built = await asyncio.gather(*(self._build(job) for job in jobs))
+        entries = [entry for job_entries in built for entry in job_entries]
+
+        await self.redis.save_many(entries, ex=CACHE_TTL, stale_after=CACHE_STALE_AFTER)
+
+        return len(entries)
+
+    async def _get_ids(self, session: AsyncSession) -> tuple[list, list]:
+        menu_ids = await MenuRepository(session).get_ids()
+        submenu_ids = await SubmenuRepository(session).get_ids()
+
+        return list(menu_ids), [tuple(row) for row in submenu_ids]
+
+    async def _build(self, job: Callable[[AsyncSession], Awaitable[list[CacheEntry]]]) -> list[CacheEntry]:
+        async with self.semaphore:
+            return await run_in_new_session(job)
+
+    @staticmethod
+    def _submenus_list_job(menu_id) -> Callable[[AsyncSession], Awaitable[list[CacheEntry]]]:
+        async def job(session: AsyncSession) -> list[CacheEntry]:
+            return [await SubmenuService(session).build_list_cache_entry(menu_id)]
+
+        return job
+
+    @staticmethod
+    def _dishes_list_job(menu_id, submenu_id) -> Callable[[AsyncSession], Awaitable[list[CacheEntry]]]:
+        async def job(session: AsyncSession) -> list[CacheEntry]:
+            return [await DishService(session).build_list_cache_entry(menu_id, submenu_id)]
+
+        return job
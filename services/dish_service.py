@@ -1,15 +1,17 @@
 import uuid
-from typing import Sequence
+from functools import partial
 
 from fastapi import BackgroundTasks, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from database.database import run_in_new_session
 from database.models import Dish
-from repositories.discount_repository import DiscountRepository
 from repositories.dish_repository import DishRepository
-from repositories.redis_repository import RedisRepository
+from repositories.redis_repository import CacheEntry, RedisRepository
 from services.google_sheet_service import GoogleSheetService
+from services.pricing_service import PricingService
 from utils import schemas
+from utils.serializers import JSONBody
 
 
 class DishService:
@@ -18,80 +20,74 @@ class DishService:
         self.repository = DishRepository(self.session)
         self.redis = RedisRepository()
         self.google_sheet_service = GoogleSheetService()
-        self.discount_repository = DiscountRepository()
+        self.pricing_service = PricingService()
 
     async def create(self, background_tasks: BackgroundTasks, dish: schemas.DishIn, menu_id: uuid.UUID,
                      submenu_id: uuid.UUID) -> Dish:
         created_dish = await self.repository.create(dish, submenu_id)
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
+        background_tasks.add_task(self.redis.invalidate_submenu, menu_id, submenu_id)
 
         return created_dish
 
-    async def get(self, submenu_id: uuid.UUID) -> Sequence[Dish]:
-        dishes_in_cache = await self.redis.get('dishes_list')
-
-        if dishes_in_cache:
-            return dishes_in_cache
-
+    async def get(self, menu_id: uuid.UUID, submenu_id: uuid.UUID) -> JSONBody:
+        return await self.redis.get_or_set(
+            menu_id, submenu_id, 'dishes_list',
+            builder=partial(self._get_dishes, submenu_id),
+            refresh=partial(run_in_new_session, lambda session: DishService(session)._get_dishes(submenu_id)),
+            tags=(menu_id, submenu_id),
+        )
+
+    async def get_by_id(self, menu_id: uuid.UUID, submenu_id: uuid.UUID, dish_id: uuid.UUID) -> JSONBody:
+        return await self.redis.get_or_set(
+            menu_id, submenu_id, dish_id,
+            builder=partial(self._get_dish, dish_id),
+            refresh=partial(run_in_new_session, lambda session: DishService(session)._get_dish(dish_id)),
+            tags=(menu_id, submenu_id),
+        )
+
+    async def build_list_cache_entry(self, menu_id: uuid.UUID, submenu_id: uuid.UUID) -> CacheEntry:
+        return CacheEntry((menu_id, submenu_id, 'dishes_list'), await self._get_dishes(submenu_id),
+                          (menu_id, submenu_id))
+
+    async def _get_dishes(self, submenu_id: uuid.UUID) -> JSONBody:
         dishes = await self.repository.get(submenu_id)
-        updated_dishes_list = []
-
-        for dish in dishes:
-            dish_data = await self.google_sheet_service.get_dish_data_by_title(dish.title)
-
-            if dish_data:
-                dish = await self.discount_repository.set_discount_for_dish(dish, dish_data['discount'])
-
-            updated_dishes_list.append(dish)
-
-        await self.redis.save('dishes_list', value=updated_dishes_list)
+        discounts = await self.google_sheet_service.get_discounts(dishes)
+        priced_dishes = await self.pricing_service.price_dishes(dishes, discounts)
 
-        return updated_dishes_list
-
-    async def get_by_id(self, menu_id: uuid.UUID, submenu_id: uuid.UUID, dish_id: uuid.UUID) -> Dish:
-        dish_in_cache = await self.redis.get(menu_id, submenu_id, dish_id)
-
-        if dish_in_cache:
-            return dish_in_cache
+        return JSONBody.from_value(priced_dishes)
 
+    async def _get_dish(self, dish_id: uuid.UUID) -> JSONBody:
         dish = await self.repository.get_by_id(dish_id)
 
         if not dish:
             raise HTTPException(status_code=404, detail='dish not found')
 
-        dish_data = await self.google_sheet_service.get_dish_data_by_title(dish.title)
-
-        if dish_data:
-            dish = await self.discount_repository.set_discount_for_dish(dish, dish_data['discount'])
+        discounts = await self.google_sheet_service.get_discounts([dish])
+        priced_dish = await self.pricing_service.price_dish(dish, discounts)
 
-        await self.redis.save(menu_id, submenu_id, dish_id, value=dish)
-
-        return dish
+        return JSONBody.from_value(priced_dish)
 
     async def update(self, background_tasks: BackgroundTasks, dish: schemas.DishIn, menu_id: uuid.UUID,
-                     dish_id: uuid.UUID) -> Dish:
+                     submenu_id: uuid.UUID, dish_id: uuid.UUID) -> schemas.DishOut:
         updated_dish = await self.repository.update(dish_id, dish)
 
         if not updated_dish:
             raise HTTPException(status_code=404, detail='dish not found')
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
-
-        dish_data = await self.google_sheet_service.get_dish_data_by_title(updated_dish.title)
+        background_tasks.add_task(self.redis.invalidate_submenu, menu_id, submenu_id)
 
-        if dish_data:
-            updated_dish = await self.discount_repository.set_discount_for_dish(updated_dish, dish_data['discount'])
+        discounts = await self.google_sheet_service.get_discounts([updated_dish])
 
-        return updated_dish
+        return await self.pricing_service.price_dish(updated_dish, discounts)
 
-    async def delete(self, background_tasks: BackgroundTasks, menu_id: uuid.UUID,
+    async def delete(self, background_tasks: BackgroundTasks, menu_id: uuid.UUID, submenu_id: uuid.UUID,
                      dish_id: uuid.UUID) -> schemas.OutAfterDelete:
         is_deleted = await self.repository.delete(dish_id)
 
         if not is_deleted:
             raise HTTPException(status_code=404, detail='dish not found')
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
+        background_tasks.add_task(self.redis.invalidate_submenu, menu_id, submenu_id)
 
         return schemas.OutAfterDelete(status=True, message='The dish has been deleted')
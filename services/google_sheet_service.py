@@ -1,23 +1,39 @@
+from typing import Any, Iterable
+
+from database.models import Dish
 from parsers.google_sheet_parser import GoogleSheetsParser
-from repositories.google_sheets_repository import GoogleSheetsRepository
+from repositories.data_sources import get_data_source
 from repositories.redis_repository import RedisRepository
 
 
 class GoogleSheetService:
     def __init__(self):
-        self.google_sheets_repository = GoogleSheetsRepository()
+        self.data_source = get_data_source()
         self.parser = GoogleSheetsParser()
         self.redis = RedisRepository()
 
-    async def get_dish_data_by_title(self, title: str):
-        dishes = await self.redis.get('dishes_data_from_google_sheet')
+    async def get_dishes_index(self) -> dict[str, dict[str, int]]:
+        """Return the sheet discounts keyed ``by_id`` and ``by_title``, cached as a single Redis value."""
+        return await self.redis.get_or_set('dishes_index_from_google_sheet', builder=self._build_dishes_index)
+
+    async def _build_dishes_index(self) -> dict[str, dict[str, int]]:
+        data = await self.data_source.get_data()
+        parsed_sheet = await self.parser.parse(data)
 
-        if not dishes:
-            data = await self.google_sheets_repository.get_data()
-            dishes = await self.parser.parse_dish_data(data)
+        return parsed_sheet.dishes_index
 
-            await self.redis.save('dishes_data_from_google_sheet', value=dishes)
+    async def get_discounts(self, dishes: Iterable[Dish]) -> dict[Any, int]:
+        """Return discounts of the given dishes by dish id, matching sheet rows by id and then by title."""
+        index = await self.get_dishes_index()
+        discounts = {}
 
         for dish in dishes:
-            if dish['title'] == title:
-                return dish
+            discount = index['by_id'].get(str(dish.id))
+
+            if discount is None:
+                discount = index['by_title'].get(str(dish.title))
+
+            if discount is not None:
+                discounts[dish.id] = discount
+
+        return discounts
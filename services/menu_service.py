@@ -1,12 +1,15 @@
 import uuid
+from functools import partial
 
 from fastapi import BackgroundTasks, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from converters.menu_converter import MenuConverter
+from database.database import run_in_new_session
 from repositories.menu_repository import MenuRepository
-from repositories.redis_repository import RedisRepository
+from repositories.redis_repository import CacheEntry, RedisRepository
 from utils import schemas
+from utils.serializers import JSONBody
 
 
 class MenuService:
@@ -20,41 +23,51 @@ class MenuService:
         created_menu = await self.repository.create(menu)
         converted_menu = await self.converter.convert_menu(created_menu)
 
-        background_tasks.add_task(self.redis.delete, ('menus_list',))
+        background_tasks.add_task(self.redis.invalidate_menu, converted_menu.id)
         return converted_menu
 
-    async def get(self) -> list[schemas.MenuOut]:
-        menus_in_cache = await self.redis.get('menus_list')
-
-        if menus_in_cache:
-            return menus_in_cache
-
+    async def get(self) -> JSONBody:
+        return await self.redis.get_or_set(
+            'menus_list',
+            builder=self._get_menus,
+            refresh=partial(run_in_new_session, lambda session: MenuService(session)._get_menus()),
+        )
+
+    async def get_menus_with_submenus_and_dishes(self) -> JSONBody:
+        return await self.redis.get_or_set(
+            'menus_list_with_submenus_and_dishes',
+            builder=self._get_menus_with_submenus_and_dishes,
+            refresh=partial(run_in_new_session,
+                            lambda session: MenuService(session)._get_menus_with_submenus_and_dishes()),
+        )
+
+    async def get_by_id(self, menu_id: uuid.UUID) -> JSONBody:
+        return await self.redis.get_or_set(
+            menu_id,
+            builder=partial(self._get_menu, menu_id),
+            refresh=partial(run_in_new_session, lambda session: MenuService(session)._get_menu(menu_id)),
+            tags=(menu_id,),
+        )
+
+    async def build_lists_cache_entries(self) -> list[CacheEntry]:
+        return [
+            CacheEntry(('menus_list',), await self._get_menus()),
+            CacheEntry(('menus_list_with_submenus_and_dishes',), await self._get_menus_with_submenus_and_dishes()),
+        ]
+
+    async def _get_menus(self) -> JSONBody:
         menus = await self.repository.get()
         converted_menus = await self.converter.convert_list_menus(menus)
 
-        await self.redis.save('menus_list', value=converted_menus)
-
-        return converted_menus
-
-    async def get_menus_with_submenus_and_dishes(self):
-        menus_in_cache = await self.redis.get('menus_list_with_submenus_and_dishes')
-
-        if menus_in_cache:
-            return menus_in_cache
+        return JSONBody.from_value(converted_menus)
 
+    async def _get_menus_with_submenus_and_dishes(self) -> JSONBody:
         menus = await self.repository.get_menus_list_with_submenus_and_dishes()
         converted_menus = await self.converter.convert_menu_with_submenus_and_dishes(menus)
 
-        await self.redis.save('menus_list_with_submenus_and_dishes', value=converted_menus)
-
-        return converted_menus
-
-    async def get_by_id(self, menu_id: uuid.UUID) -> schemas.MenuOut:
-        menu_in_cache = await self.redis.get(menu_id)
-
-        if menu_in_cache:
-            return menu_in_cache
+        return JSONBody.from_value(converted_menus)
 
+    async def _get_menu(self, menu_id: uuid.UUID) -> JSONBody:
         menu = await self.repository.get_by_id_with_counts(menu_id)
 
         if not menu:
@@ -62,9 +75,7 @@ class MenuService:
 
         converted_menu = await self.converter.convert_menu(menu)
 
-        await self.redis.save(menu_id, value=converted_menu)
-
-        return converted_menu
+        return JSONBody.from_value(converted_menu)
 
     async def update(self, background_tasks: BackgroundTasks, menu: schemas.MenuIn, menu_id: uuid.UUID) -> schemas.MenuOut:
         updated_menu = await self.repository.update(menu_id, menu)
@@ -74,7 +85,7 @@ class MenuService:
 
         converted_menu = await self.converter.convert_menu(updated_menu)
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
+        background_tasks.add_task(self.redis.invalidate_menu, menu_id)
 
         return converted_menu
 
@@ -84,6 +95,6 @@ class MenuService:
         if not is_deleted:
             raise HTTPException(status_code=404, detail='menu not found')
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
+        background_tasks.add_task(self.redis.invalidate_menu, menu_id)
 
         return schemas.OutAfterDelete(status=True, message='The menu has been deleted')
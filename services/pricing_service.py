@@ -0,0 +1,40 @@
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Sequence
+
+from database.models import Dish
+from utils import schemas
+
+CENT = Decimal('0.01')
+
+
+class PricingService:
+    """
+    Applies percentage discounts to whole dish collections and returns priced ``DishOut`` objects.
+
+    Prices are taken to the cent and the discounted price is rounded half up to the cent,
+    ORM objects are left untouched and, as their fields are already valid, the DTOs are built
+    without validation.
+    """
+
+    async def price_dishes(self, dishes: Sequence[Dish], discounts: dict[Any, int]) -> list[schemas.DishOut]:
+        prices = await self._price_with_decimals(dishes, discounts)
+
+        return [
+            schemas.DishOut.model_construct(id=dish.id, title=dish.title, description=dish.description, price=price)
+            for dish, price in zip(dishes, prices)
+        ]
+
+    async def price_dish(self, dish: Dish, discounts: dict[Any, int]) -> schemas.DishOut:
+        priced_dishes = await self.price_dishes([dish], discounts)
+
+        return priced_dishes[0]
+
+    async def _price_with_decimals(self, dishes: Sequence[Dish], discounts: dict[Any, int]) -> list[str]:
+        prices = []
+
+        for dish in dishes:
+            price = Decimal(str(dish.price)).quantize(CENT, ROUND_HALF_UP)
+            discounted_price = price * (100 - discounts.get(dish.id, 0)) / 100
+            prices.append(str(discounted_price.quantize(CENT, ROUND_HALF_UP)))
+
+        return prices
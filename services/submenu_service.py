@@ -1,13 +1,16 @@
 import uuid
+from functools import partial
 
 from fastapi import BackgroundTasks, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from converters.submenu_converter import SubmenuConverter
-from repositories.redis_repository import RedisRepository
+from database.database import run_in_new_session
+from repositories.redis_repository import CacheEntry, RedisRepository
 from repositories.submenu_repository import SubmenuRepository
 from utils import schemas
 from utils.schemas import SubmenuOut
+from utils.serializers import JSONBody
 
 
 class SubmenuService:
@@ -21,29 +24,36 @@ class SubmenuService:
         created_submenu = await self.repository.create(submenu, menu_id)
         converted_submenu = await self.converter.convert_menu(created_submenu)
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
+        background_tasks.add_task(self.redis.invalidate_submenu, menu_id, converted_submenu.id)
 
         return converted_submenu
 
-    async def get(self, menu_id: uuid.UUID) -> list[schemas.SubmenuOut]:
-        submenus_in_cache = await self.redis.get('submenus_list')
-
-        if submenus_in_cache:
-            return submenus_in_cache
-
+    async def get(self, menu_id: uuid.UUID) -> JSONBody:
+        return await self.redis.get_or_set(
+            menu_id, 'submenus_list',
+            builder=partial(self._get_submenus, menu_id),
+            refresh=partial(run_in_new_session, lambda session: SubmenuService(session)._get_submenus(menu_id)),
+            tags=(menu_id,),
+        )
+
+    async def get_by_id(self, menu_id: uuid.UUID, submenu_id: uuid.UUID) -> JSONBody:
+        return await self.redis.get_or_set(
+            menu_id, submenu_id,
+            builder=partial(self._get_submenu, submenu_id),
+            refresh=partial(run_in_new_session, lambda session: SubmenuService(session)._get_submenu(submenu_id)),
+            tags=(menu_id, submenu_id),
+        )
+
+    async def build_list_cache_entry(self, menu_id: uuid.UUID) -> CacheEntry:
+        return CacheEntry((menu_id, 'submenus_list'), await self._get_submenus(menu_id), (menu_id,))
+
+    async def _get_submenus(self, menu_id: uuid.UUID) -> JSONBody:
         submenus = await self.repository.get(menu_id)
         converted_submenus = await self.converter.convert_list_submenus(submenus)
 
-        await self.redis.save('submenus_list', value=converted_submenus)
-
-        return converted_submenus
-
-    async def get_by_id(self, menu_id: uuid.UUID, submenu_id: uuid.UUID) -> SubmenuOut:
-        submenu_in_cache = await self.redis.get(menu_id, submenu_id)
-
-        if submenu_in_cache:
-            return submenu_in_cache
+        return JSONBody.from_value(converted_submenus)
 
+    async def _get_submenu(self, submenu_id: uuid.UUID) -> JSONBody:
         submenu = await self.repository.get_by_id_with_counts(submenu_id)
 
         if not submenu:
@@ -51,9 +61,7 @@ class SubmenuService:
 
         converted_submenu = await self.converter.convert_menu(submenu)
 
-        await self.redis.save(menu_id, submenu_id, value=converted_submenu)
-
-        return converted_submenu
+        return JSONBody.from_value(converted_submenu)
 
     async def update(self, background_tasks: BackgroundTasks, submenu: schemas.SubmenuIn, menu_id: uuid.UUID, submenu_id: uuid.UUID) -> SubmenuOut:
         updated_submenu = await self.repository.update(submenu_id, submenu)
@@ -63,7 +71,7 @@ class SubmenuService:
 
         converted_submenu = await self.converter.convert_menu(updated_submenu)
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
+        background_tasks.add_task(self.redis.invalidate_submenu, menu_id, submenu_id)
 
         return converted_submenu
 
@@ -73,6 +81,6 @@ class SubmenuService:
         if not is_deleted:
             raise HTTPException(status_code=404, detail='submenu not found')
 
-        background_tasks.add_task(self.redis.delete_parents_and_children_keys, menu_id)
+        background_tasks.add_task(self.redis.invalidate_submenu, menu_id, submenu_id)
 
         return schemas.OutAfterDelete(status=True, message='The submenu has been deleted')
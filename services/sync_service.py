@@ -0,0 +1,60 @@
+from config import (
+    SYNC_LOCK_TTL,
+    SYNC_MAX_INTERVAL,
+    SYNC_POLL_INTERVAL,
+    SYNC_TRIGGER_DEBOUNCE,
+)
+from database.database import run_in_new_session
+from repositories.redis_repository import RedisRepository
+from services.task_service import TaskService
+
+MAX_BACKOFF_EXPONENT = 10
+
+
+class SyncService:
+    """Runs the sheet sync in one process at a time, coalescing skipped runs and backing off while unchanged."""
+
+    def __init__(self):
+        self.redis = RedisRepository()
+
+    async def run(self, force: bool = False) -> bool:
+        if not force and await self.redis.has_flag('sheet_sync_backoff'):
+            return False
+
+        async with self.redis.lease('sheet_sync', SYNC_LOCK_TTL) as acquired:
+            if not acquired:
+                await self.redis.set_flag('sheet_sync_pending', ex=SYNC_LOCK_TTL)
+                await self.redis.incr('sheet_sync_skipped')
+                return False
+
+            await self.redis.pop_flag('sheet_sync_pending')
+            changed = False
+
+            while True:
+                changed |= await run_in_new_session(lambda session: TaskService(session).check_data())
+
+                if not await self.redis.pop_flag('sheet_sync_pending'):
+                    break
+
+            await self._schedule_next_run(changed)
+
+            return True
+
+    async def _schedule_next_run(self, changed: bool) -> None:
+        if changed:
+            await self.redis.pop_flag('sheet_sync_unchanged_runs')
+            await self.redis.pop_flag('sheet_sync_backoff')
+            return
+
+        unchanged_runs = await self.redis.incr('sheet_sync_unchanged_runs')
+        interval = min(SYNC_POLL_INTERVAL * 2 ** min(unchanged_runs, MAX_BACKOFF_EXPONENT), SYNC_MAX_INTERVAL)
+
+        if interval > SYNC_POLL_INTERVAL:
+            await self.redis.set_flag('sheet_sync_backoff', ex=interval - SYNC_POLL_INTERVAL)
+
+    async def request_run(self) -> bool:
+        """Claim the debounce window for an on-demand run; ``False`` if a run is already requested in it."""
+        return await self.redis.set_flag('sheet_sync_requested', ex=SYNC_TRIGGER_DEBOUNCE, nx=True)
+
+    async def get_skipped_runs(self) -> int:
+        return await self.redis.get_counter('sheet_sync_skipped')
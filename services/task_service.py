@@ -1,93 +1,153 @@
+import logging
+import uuid
+from typing import Any, Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from parsers.google_sheet_parser import GoogleSheetsParser
+from config import SYNC_MARKER_TTL
+from parsers.google_sheet_parser import DishRow, GoogleSheetsParser, MenuRow, SubmenuRow
+from repositories.data_sources import get_data_source
 from repositories.dish_repository import DishRepository
-from repositories.google_sheets_repository import GoogleSheetsRepository
 from repositories.menu_repository import MenuRepository
 from repositories.redis_repository import RedisRepository
 from repositories.submenu_repository import SubmenuRepository
-from utils import schemas
+from services.cache_warmup_service import CacheWarmupService
+
+ID_FIELDS = {'id', 'menu_id', 'submenu_id'}
+
+logger = logging.getLogger(__name__)
 
 
 class TaskService:
     def __init__(self, session: AsyncSession):
-        self.google_sheets_repository = GoogleSheetsRepository()
+        self.data_source = get_data_source()
         self.parser = GoogleSheetsParser()
         self.session = session
         self.menu_repository = MenuRepository(session)
         self.submenu_repository = SubmenuRepository(session)
         self.dish_repository = DishRepository(session)
         self.redis = RedisRepository()
-
-    async def check_data(self) -> None:
-        data = await self.google_sheets_repository.get_data()
-
-        data_in_cache = await self.redis.get('data_from_google_sheet')
-
-        if data_in_cache == data:
-            return None
-
-        parsed_data = await self.parser.parse_data(data)
-
-        for menu_item in parsed_data:
-            await self.redis.delete_parents_and_children_keys(menu_item['id'])
-
-            menu = await self.menu_repository.get_by_id(menu_item['id'])
-
-            if not menu:
-                menu_data = schemas.MenuIn(id=menu_item['id'], title=menu_item['title'],
-                                           description=menu_item['description'])
-                await self.menu_repository.create(menu_data)
-
-                await self.redis.delete('menus_list')
-
-            elif menu.title != menu_item['title'] or menu.description != menu_item['description']:
-                menu_data = schemas.MenuIn(title=menu_item['title'], description=menu_item['description'])
-                await self.menu_repository.update(menu.id, menu_data)
-
-                await self.redis.delete_parents_and_children_keys(menu.id)
-
-            for submenu_item in menu_item['submenus']:
-                submenu = await self.submenu_repository.get_by_id(submenu_item['id'])
-
-                if not submenu:
-                    submenu_data = schemas.SubmenuIn(id=submenu_item['id'], title=submenu_item['title'],
-                                                     description=submenu_item['description'])
-                    await self.submenu_repository.create(submenu_data, menu_item['id'])
-
-                    await self.redis.delete_parents_and_children_keys(menu_item['id'])
-
-                elif submenu.title != submenu_item['title'] or submenu.description != submenu_item['description']:
-                    submenu_data = schemas.SubmenuIn(title=submenu_item['title'],
-                                                     description=submenu_item['description'])
-                    await self.submenu_repository.update(submenu.id, submenu_data)
-
-                    await self.redis.delete_parents_and_children_keys(menu_item['id'])
-
-                for dish_item in submenu_item['dishes']:
-                    dish = await self.dish_repository.get_by_id(dish_item['id'])
-
-                    if not dish:
-                        dish_data = schemas.DishIn(id=dish_item['id'], title=dish_item['title'],
-                                                   description=dish_item['description'], price=dish_item['price'])
-                        await self.dish_repository.create(dish_data, submenu_item['id'])
-
-                        await self.redis.delete_parents_and_children_keys(menu_item['id'])
-
-                    elif dish.title != dish_item['title'] or dish.description != dish_item[
-                            'description'] or dish.price != dish_item['price']:
-                        dish_data = schemas.DishIn(title=dish_item['title'],
-                                                   description=dish_item['description'], price=dish_item['price'])
-                        await self.dish_repository.update(dish.id, dish_data)
-
-                        await self.redis.delete_parents_and_children_keys(menu_item['id'])
-
-        await self.redis.save('data_from_google_sheet', value=data)
-
-    async def get_dish_data_by_title(self, title: str):
-        data = await self.google_sheets_repository.get_data()
-        dishes = await self.parser.parse_dish_data(data)
-
-        for dish in dishes:
-            if dish['title'] == title:
-                return dish
+        self.cache_warmup_service = CacheWarmupService()
+
+    async def check_data(self) -> bool:
+        """Sync the changed sheet rows into the database and return whether any row was written or deleted."""
+        revision = await self.data_source.get_revision()
+
+        if revision is not None and revision == await self.redis.get('google_sheet_revision'):
+            return False
+
+        data = await self.data_source.get_data()
+        digest = await self.parser.get_digest(data)
+
+        if digest == await self.redis.get('google_sheet_digest'):
+            if revision is not None:
+                await self.redis.save('google_sheet_revision', value=revision, ex=SYNC_MARKER_TTL)
+            return False
+
+        parsed_sheet = await self.parser.parse(data)
+
+        for error in parsed_sheet.errors:
+            logger.warning('Skipped sheet row %s (%s): %s', error.number, error.reason, error.row)
+
+        existing_menus = await self._get_fingerprints(self.menu_repository)
+        existing_submenus = await self._get_fingerprints(self.submenu_repository)
+        existing_dishes = await self._get_fingerprints(self.dish_repository)
+
+        changed_menus = await self._upsert_changed(self.menu_repository, parsed_sheet.menus,
+                                                   ('title', 'description'), existing_menus)
+        changed_submenus = await self._upsert_changed(self.submenu_repository, parsed_sheet.submenus,
+                                                      ('title', 'description', 'menu_id'), existing_submenus)
+        changed_dishes = await self._upsert_changed(self.dish_repository, parsed_sheet.dishes,
+                                                    ('title', 'description', 'price', 'submenu_id'), existing_dishes)
+
+        if parsed_sheet.menus:
+            kept_ids = parsed_sheet.row_digests.keys() | parsed_sheet.malformed_ids
+            deleted_dishes = existing_dishes.keys() - kept_ids
+            deleted_submenus = existing_submenus.keys() - kept_ids - self._get_parents_in_use(
+                existing_dishes, deleted_dishes | changed_dishes
+            )
+            deleted_menus = existing_menus.keys() - kept_ids - self._get_parents_in_use(
+                existing_submenus, deleted_submenus | changed_submenus
+            )
+
+            await self.dish_repository.delete_many(deleted_dishes)
+            await self.submenu_repository.delete_many(deleted_submenus)
+            await self.menu_repository.delete_many(deleted_menus)
+        else:
+            deleted_dishes = deleted_submenus = deleted_menus = set()
+
+        await self.session.commit()
+
+        await self.redis.save('dishes_index_from_google_sheet', value=parsed_sheet.dishes_index)
+
+        touched_menus = changed_menus | deleted_menus
+        touched_submenus = {
+            (submenu.menu_id, submenu.id) for submenu in parsed_sheet.submenus if submenu.id in changed_submenus
+        }
+        touched_submenus.update(
+            (dish.menu_id, dish.submenu_id) for dish in parsed_sheet.dishes if dish.id in changed_dishes
+        )
+        # Rows that moved or disappeared also leave their former parents stale.
+        former_dishes = deleted_dishes | (changed_dishes & existing_dishes.keys())
+        former_submenus = deleted_submenus | (changed_submenus & existing_submenus.keys())
+        touched_submenus.update(
+            (existing_submenus[submenu_id][-1], submenu_id) for submenu_id in former_submenus
+        )
+        touched_submenus.update(
+            (existing_submenus[submenu_id][-1], submenu_id)
+            for submenu_id in {existing_dishes[dish_id][-1] for dish_id in former_dishes}
+            if submenu_id in existing_submenus
+        )
+
+        await self.redis.invalidate_scopes(menu_ids=touched_menus, submenus=touched_submenus)
+
+        await self.redis.save('google_sheet_digest', value=digest, ex=SYNC_MARKER_TTL)
+
+        if revision is not None:
+            await self.redis.save('google_sheet_revision', value=revision, ex=SYNC_MARKER_TTL)
+
+        current_submenus = {(submenu.menu_id, submenu.id) for submenu in parsed_sheet.submenus}
+        warmed_submenus = touched_submenus & current_submenus
+        warmed_menus = (touched_menus - deleted_menus) | {menu_id for menu_id, _ in warmed_submenus}
+
+        await self.cache_warmup_service.warm_up(
+            menu_ids=[uuid.UUID(menu_id) for menu_id in warmed_menus],
+            submenu_ids=[(uuid.UUID(menu_id), uuid.UUID(submenu_id)) for menu_id, submenu_id in warmed_submenus],
+        )
+
+        return any((changed_menus, changed_submenus, changed_dishes, deleted_menus, deleted_submenus, deleted_dishes))
+
+    async def _get_fingerprints(
+            self, repository: MenuRepository | SubmenuRepository | DishRepository
+    ) -> dict[str, tuple]:
+        """Return the stored ``source_hash`` and parent id of every row by id, with ids as strings."""
+        return {
+            str(row.id): tuple(str(value) if isinstance(value, uuid.UUID) else value for value in row[1:])
+            for row in await repository.get_fingerprints()
+        }
+
+    @staticmethod
+    def _get_parents_in_use(existing_rows: dict[str, tuple], moved_or_deleted_ids: set[str]) -> set[str]:
+        """Return the parents still referenced by rows that stay, including kept malformed child rows."""
+        return {row[-1] for row_id, row in existing_rows.items() if row_id not in moved_or_deleted_ids}
+
+    async def _upsert_changed(self, repository: MenuRepository | SubmenuRepository | DishRepository,
+                              records: Sequence[MenuRow | SubmenuRow | DishRow], fields: Sequence[str],
+                              existing_rows: dict[str, tuple]) -> set[str]:
+        """Write the records whose digest differs from their stored ``source_hash`` in bulk and return their ids."""
+        changed_rows: dict[str, dict[str, Any]] = {}
+
+        for record in records:
+            if record.id in changed_rows or existing_rows.get(record.id, (None,))[0] == record.digest:
+                continue
+
+            changed_rows[record.id] = {
+                'id': uuid.UUID(record.id),
+                'source_hash': record.digest,
+                **{field: uuid.UUID(getattr(record, field)) if field in ID_FIELDS else getattr(record, field)
+                   for field in fields},
+            }
+
+        await repository.upsert_many(list(changed_rows.values()))
+
+        return set(changed_rows)
@@ -2,10 +2,12 @@ from typing import Any, AsyncGenerator
 
 import pytest
 from httpx import AsyncClient
+from pytest_asyncio import is_async_test
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
+import database.database
 from database.database import get_async_session
 from database.models import Base
 from main import app
@@ -21,6 +23,7 @@ async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 app.dependency_overrides[get_async_session] = override_get_async_session
+database.database.async_session = TestingSessionLocal
 
 
 async def reverse(route_name: str, **path_params: Any) -> str:
@@ -33,6 +36,14 @@ async def reverse(route_name: str, **path_params: Any) -> str:
     return url
 
 
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    session_scope_marker = pytest.mark.asyncio(scope='session')
+
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
 @pytest.fixture(autouse=True, scope='session')
 async def prepare_database(request: pytest.FixtureRequest) -> AsyncGenerator[None, None]:
     async with engine_test.begin() as conn:
@@ -44,7 +55,7 @@ async def prepare_database(request: pytest.FixtureRequest) -> AsyncGenerator[Non
 
 @pytest.fixture(scope='session')
 async def ac() -> AsyncGenerator[AsyncClient, None]:
-    async with AsyncClient(app=app, base_url='http://test') as ac:
+    async with app.router.lifespan_context(app), AsyncClient(app=app, base_url='http://test') as ac:
         yield ac
 
 
@@ -0,0 +1,87 @@
+from typing import Any
+
+from httpx import AsyncClient
+
+from .conftest import reverse
+
+
+async def test_create_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My menu 1',
+        'description': 'My menu description 1'
+    }
+    url = await reverse('create_menu')
+    response = await ac.post(url, json=data)
+
+    buffer_data.update(menu=response.json())
+
+    assert response.status_code == 201
+
+
+async def test_create_submenus(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('create_submenu', menu_id=buffer_data['menu']['id'])
+
+    for name in ('first_submenu', 'second_submenu'):
+        data = {
+            'title': f'My {name}',
+            'description': f'My {name} description'
+        }
+        response = await ac.post(url, json=data)
+        buffer_data[name] = response.json()
+
+        assert response.status_code == 201
+
+
+async def test_create_dish_in_first_submenu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My dish 1',
+        'description': 'My dish description 1',
+        'price': '12.50'
+    }
+    url = await reverse('create_dish', menu_id=buffer_data['menu']['id'],
+                        submenu_id=buffer_data['first_submenu']['id'])
+    response = await ac.post(url, json=data)
+
+    assert response.status_code == 201
+
+
+async def test_dishes_lists_are_cached_per_submenu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    first_url = await reverse('get_list_dishes', menu_id=buffer_data['menu']['id'],
+                              submenu_id=buffer_data['first_submenu']['id'])
+    second_url = await reverse('get_list_dishes', menu_id=buffer_data['menu']['id'],
+                               submenu_id=buffer_data['second_submenu']['id'])
+
+    first_response = await ac.get(first_url)
+    second_response = await ac.get(second_url)
+
+    assert first_response.status_code == 200
+    assert len(first_response.json()) == 1
+    assert second_response.status_code == 200
+    assert len(second_response.json()) == 0
+
+
+async def test_submenus_lists_are_cached_per_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('create_menu')
+    response = await ac.post(url, json={'title': 'My menu 2', 'description': 'My menu description 2'})
+    other_menu = response.json()
+
+    first_url = await reverse('get_list_submenus', menu_id=buffer_data['menu']['id'])
+    second_url = await reverse('get_list_submenus', menu_id=other_menu['id'])
+
+    first_response = await ac.get(first_url)
+    second_response = await ac.get(second_url)
+
+    assert len(first_response.json()) == 2
+    assert len(second_response.json()) == 0
+
+    url = await reverse('delete_menu_by_id', menu_id=other_menu['id'])
+    await ac.delete(url)
+
+
+async def test_delete_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('delete_menu_by_id', menu_id=buffer_data['menu']['id'])
+    response = await ac.delete(url)
+
+    assert response.status_code == 200
+
+    buffer_data.clear()
@@ -0,0 +1,106 @@
+import uuid
+from typing import Any
+
+import orjson
+from httpx import AsyncClient
+
+from repositories.redis_repository import MENUS_LISTS_KEYS, RedisRepository
+from services.cache_warmup_service import CacheWarmupService
+
+from .conftest import reverse
+
+
+async def test_create_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My menu 1',
+        'description': 'My menu description 1'
+    }
+    url = await reverse('create_menu')
+    response = await ac.post(url, json=data)
+
+    buffer_data.update(menu=response.json())
+
+    assert response.status_code == 201
+
+
+async def test_create_submenu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My submenu 1',
+        'description': 'My submenu description 1'
+    }
+    url = await reverse('create_submenu', menu_id=buffer_data['menu']['id'])
+    response = await ac.post(url, json=data)
+
+    buffer_data.update(submenu=response.json())
+
+    assert response.status_code == 201
+
+
+async def test_create_dish(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My dish 1',
+        'description': 'My dish description 1',
+        'price': '12.50'
+    }
+    url = await reverse('create_dish', menu_id=buffer_data['menu']['id'], submenu_id=buffer_data['submenu']['id'])
+    response = await ac.post(url, json=data)
+
+    buffer_data.update(dish=response.json())
+
+    assert response.status_code == 201
+
+
+async def test_warm_up_fills_lists(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    redis = RedisRepository()
+    menu_id, submenu_id = buffer_data['menu']['id'], buffer_data['submenu']['id']
+    keys = (
+        *MENUS_LISTS_KEYS,
+        await redis.converter.generate_key(menu_id, 'submenus_list'),
+        await redis.converter.generate_key(menu_id, submenu_id, 'dishes_list'),
+    )
+    await redis.unlink(*keys)
+
+    await CacheWarmupService().warm_up()
+
+    menus_list, _, submenus_list, dishes_list = await redis.mget(*((key,) for key in keys))
+
+    assert menus_list is not None and submenus_list is not None and dishes_list is not None
+    assert [menu['id'] for menu in orjson.loads(menus_list.content)] == [menu_id]
+    assert [submenu['id'] for submenu in orjson.loads(submenus_list.content)] == [submenu_id]
+    assert orjson.loads(dishes_list.content) == [buffer_data['dish']]
+
+
+async def test_warm_up_fills_given_lists_only(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    redis = RedisRepository()
+    menu_id, submenu_id = buffer_data['menu']['id'], buffer_data['submenu']['id']
+    keys = (
+        await redis.converter.generate_key(menu_id, 'submenus_list'),
+        await redis.converter.generate_key(menu_id, submenu_id, 'dishes_list'),
+    )
+    await redis.unlink(*keys)
+
+    await CacheWarmupService().warm_up(menu_ids=[uuid.UUID(menu_id)], submenu_ids=[])
+
+    submenus_list, dishes_list = await redis.mget(*((key,) for key in keys))
+
+    assert submenus_list is not None
+    assert [submenu['id'] for submenu in orjson.loads(submenus_list.content)] == [submenu_id]
+    assert dishes_list is None
+
+
+async def test_get_list_dishes_after_warm_up(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('get_list_dishes', menu_id=buffer_data['menu']['id'],
+                        submenu_id=buffer_data['submenu']['id'])
+    response = await ac.get(url)
+
+    assert response.status_code == 200
+    assert response.json() == [buffer_data['dish']]
+
+
+async def test_delete_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('delete_menu_by_id', menu_id=buffer_data['menu']['id'])
+    response = await ac.delete(url)
+
+    assert response.status_code == 200
+
+    buffer_data.clear()
@@ -0,0 +1,129 @@
+import asyncio
+import uuid
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+from parsers.google_sheet_parser import GoogleSheetsParser
+from repositories.google_sheets_repository import GoogleSheetsRepository
+from repositories.redis_repository import RedisRepository
+from services.google_sheet_service import GoogleSheetService
+
+from .conftest import reverse
+
+
+async def test_create_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My menu 1',
+        'description': 'My menu description 1'
+    }
+    url = await reverse('create_menu')
+    response = await ac.post(url, json=data)
+
+    buffer_data.update(menu=response.json())
+
+    assert response.status_code == 201
+
+
+async def test_create_submenu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My submenu 1',
+        'description': 'My submenu description 1'
+    }
+    url = await reverse('create_submenu', menu_id=buffer_data['menu']['id'])
+    response = await ac.post(url, json=data)
+
+    buffer_data.update(submenu=response.json())
+
+    assert response.status_code == 201
+
+
+async def test_create_dishes(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('create_dish', menu_id=buffer_data['menu']['id'], submenu_id=buffer_data['submenu']['id'])
+
+    for name in ('first_dish', 'second_dish', 'third_dish'):
+        data = {
+            'title': f'My {name}',
+            'description': f'My {name} description',
+            'price': '100.00'
+        }
+        response = await ac.post(url, json=data)
+        buffer_data[name] = response.json()
+
+        assert response.status_code == 201
+
+
+async def test_set_dishes_index(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    unknown_dish_id = str(uuid.uuid4())
+    rows = [
+        [str(uuid.uuid4()), 'Sheet menu', 'Sheet menu description'],
+        ['', str(uuid.uuid4()), 'Sheet submenu', 'Sheet submenu description'],
+        ['', '', buffer_data['first_dish']['id'], 'Renamed in sheet', '', '100.00', '10'],
+        ['', '', unknown_dish_id, 'My second_dish', '', '100.00', '25'],
+    ]
+    parsed_sheet = await GoogleSheetsParser().parse(rows)
+
+    await RedisRepository().save('dishes_index_from_google_sheet', value=parsed_sheet.dishes_index)
+
+    assert parsed_sheet.dishes_index == {
+        'by_id': {buffer_data['first_dish']['id']: 10, unknown_dish_id: 25},
+        'by_title': {'Renamed in sheet': 10, 'My second_dish': 25},
+    }
+
+
+async def test_get_list_dishes_with_discounts(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('get_list_dishes', menu_id=buffer_data['menu']['id'],
+                        submenu_id=buffer_data['submenu']['id'])
+    response = await ac.get(url)
+    prices = {dish['id']: dish['price'] for dish in response.json()}
+
+    assert response.status_code == 200
+    assert prices[buffer_data['first_dish']['id']] == '90.00'
+    assert prices[buffer_data['second_dish']['id']] == '75.00'
+    assert prices[buffer_data['third_dish']['id']] == '100.00'
+
+
+async def test_get_menus_with_submenus_and_dishes_with_discounts(ac: AsyncClient,
+                                                                 buffer_data: dict[str, Any]) -> None:
+    url = await reverse('get_list_menus_with_submenus_and_dishes')
+    response = await ac.get(url)
+    dishes = response.json()[0]['submenus'][0]['dishes']
+    prices = {dish['id']: dish['price'] for dish in dishes}
+
+    assert response.status_code == 200
+    assert prices[buffer_data['first_dish']['id']] == '90.00'
+    assert prices[buffer_data['second_dish']['id']] == '75.00'
+
+
+async def test_delete_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    await RedisRepository().unlink('dishes_index_from_google_sheet')
+
+    url = await reverse('delete_menu_by_id', menu_id=buffer_data['menu']['id'])
+    response = await ac.delete(url)
+
+    assert response.status_code == 200
+
+    buffer_data.clear()
+
+
+async def test_dishes_index_is_built_once(ac: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    dish_id = str(uuid.uuid4())
+    downloads = []
+
+    async def get_data(*args: Any) -> list[list]:
+        downloads.append(dish_id)
+        await asyncio.sleep(0.05)
+
+        return [[str(uuid.uuid4()), 'Menu', ''], ['', str(uuid.uuid4()), 'Submenu', ''],
+                ['', '', dish_id, 'Dish', '', '100.00', '5']]
+
+    monkeypatch.setattr(GoogleSheetsRepository, 'get_data', get_data)
+    await RedisRepository().unlink('dishes_index_from_google_sheet')
+
+    indexes = await asyncio.gather(*(GoogleSheetService().get_dishes_index() for _ in range(5)))
+
+    assert downloads == [dish_id]
+    assert all(index['by_id'] == {dish_id: 5} for index in indexes)
+
+    await RedisRepository().unlink('dishes_index_from_google_sheet')
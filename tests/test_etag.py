@@ -0,0 +1,63 @@
+from typing import Any
+
+from httpx import AsyncClient
+
+from .conftest import reverse
+
+
+async def test_create_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My menu 1',
+        'description': 'My menu description 1'
+    }
+    url = await reverse('create_menu')
+    response = await ac.post(url, json=data)
+
+    buffer_data.update(menu=response.json())
+
+    assert response.status_code == 201
+
+
+async def test_get_menu_by_id_returns_etag(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('get_menu_by_id', menu_id=buffer_data['menu']['id'])
+    response = await ac.get(url)
+
+    buffer_data.update(etag=response.headers['etag'])
+
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == buffer_data['menu']
+
+
+async def test_get_menu_by_id_not_modified(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('get_menu_by_id', menu_id=buffer_data['menu']['id'])
+    response = await ac.get(url, headers={'If-None-Match': buffer_data['etag']})
+
+    assert response.status_code == 304
+    assert response.headers['etag'] == buffer_data['etag']
+    assert response.content == b''
+
+
+async def test_get_menu_by_id_after_update(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    data = {
+        'title': 'My updated menu 1',
+        'description': 'My updated menu description 1'
+    }
+    url = await reverse('update_menu_by_id', menu_id=buffer_data['menu']['id'])
+    await ac.patch(url, json=data)
+
+    url = await reverse('get_menu_by_id', menu_id=buffer_data['menu']['id'])
+    response = await ac.get(url, headers={'If-None-Match': buffer_data['etag']})
+
+    assert response.status_code == 200
+    assert response.headers['etag'] != buffer_data['etag']
+    assert response.json()['title'] == data['title']
+
+
+async def test_delete_menu(ac: AsyncClient, buffer_data: dict[str, Any]) -> None:
+    url = await reverse('delete_menu_by_id', menu_id=buffer_data['menu']['id'])
+    response = await ac.delete(url)
+
+    assert response.status_code == 200
+
+    buffer_data.clear()
@@ -0,0 +1,82 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from repositories import google_sheets_repository
+from repositories.google_sheets_repository import GoogleSheetsRepository
+
+
+async def test_get_data_does_not_block_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow_fetch(self: GoogleSheetsRepository) -> list[list]:
+        time.sleep(0.2)
+        return [['menu_id', 'Menu', 'Menu description']]
+
+    monkeypatch.setattr(GoogleSheetsRepository, '_fetch_data', slow_fetch)
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    data = await GoogleSheetsRepository().get_data()
+    ticker.cancel()
+
+    assert data == [['menu_id', 'Menu', 'Menu description']]
+    assert ticks >= 5
+
+
+async def test_get_data_times_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(GoogleSheetsRepository, '_fetch_data', lambda self: time.sleep(0.3))
+    monkeypatch.setattr(google_sheets_repository, 'GOOGLE_SHEETS_TIMEOUT', 0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await GoogleSheetsRepository().get_data()
+
+
+class FakeHTTPClient:
+    def set_timeout(self, timeout: float) -> None:
+        self.timeout = timeout
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.http_client = FakeHTTPClient()
+        self.opened: list[tuple[str, str]] = []
+
+    def open(self, title: str) -> SimpleNamespace:
+        self.opened.append(('name', title))
+        return SimpleNamespace(sheet1=SimpleNamespace())
+
+    def open_by_key(self, key: str) -> SimpleNamespace:
+        self.opened.append(('key', key))
+        return SimpleNamespace(sheet1=SimpleNamespace())
+
+
+async def test_worksheet_is_reused(monkeypatch: pytest.MonkeyPatch) -> None:
+    clients = []
+
+    def service_account(filename: str) -> FakeClient:
+        clients.append(FakeClient())
+        return clients[-1]
+
+    monkeypatch.setattr(google_sheets_repository.gspread, 'service_account', service_account)
+    monkeypatch.setattr(google_sheets_repository, 'worksheet', None)
+    monkeypatch.setattr(google_sheets_repository, 'GOOGLE_SHEETS_SPREADSHEET_KEY', 'spreadsheet_key')
+
+    repository = GoogleSheetsRepository()
+    first_worksheet = repository._get_worksheet()
+    second_worksheet = repository._get_worksheet()
+
+    assert first_worksheet is second_worksheet
+    assert len(clients) == 1
+    assert clients[0].opened == [('key', 'spreadsheet_key')]
+
+    repository._reset_worksheet()
+    repository._get_worksheet()
+
+    assert len(clients) == 2
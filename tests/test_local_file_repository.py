@@ -0,0 +1,72 @@
+import os
+from pathlib import Path
+
+import openpyxl
+import pytest
+from httpx import AsyncClient
+
+import repositories.data_sources
+from database.database import run_in_new_session
+from repositories.local_file_repository import LocalFileRepository
+from repositories.redis_repository import RedisRepository
+from services.task_service import TaskService
+
+from .conftest import reverse
+
+ROWS = [
+    ['menu_id', 'Menu', 'Menu description'],
+    ['', 'submenu_id', 'Submenu', 'Submenu description'],
+    ['', '', 'dish_id', 'Dish', 'Dish description', '12.5', '10'],
+]
+
+
+async def test_get_data_from_xlsx(tmp_path: Path) -> None:
+    path = tmp_path / 'Menu.xlsx'
+    workbook = openpyxl.Workbook()
+    workbook.active.append(['menu_id', 'Menu', 'Menu description', None])
+    workbook.active.append([None, 'submenu_id', 'Submenu', 'Submenu description'])
+    workbook.active.append([None, None, None])
+    workbook.active.append([None, None, 'dish_id', 'Dish', 'Dish description', 12.5, 10.0])
+    workbook.save(path)
+
+    assert await LocalFileRepository(str(path)).get_data() == ROWS
+
+
+async def test_get_data_from_csv(tmp_path: Path) -> None:
+    path = tmp_path / 'Menu.csv'
+    path.write_text('menu_id,Menu,Menu description,,\n,submenu_id,Submenu,Submenu description\n'
+                    ',,dish_id,Dish,Dish description,12.5,10\n', encoding='utf-8')
+
+    assert await LocalFileRepository(str(path)).get_data() == ROWS
+
+
+async def test_file_is_reread_when_mtime_changes(tmp_path: Path) -> None:
+    path = tmp_path / 'Menu.csv'
+    path.write_text('menu_id,Menu,Menu description\n', encoding='utf-8')
+    repository = LocalFileRepository(str(path))
+
+    first_revision = await repository.get_revision()
+    assert await repository.get_data() == [ROWS[0]]
+
+    path.write_text('other_menu_id,Other menu,Other menu description\n', encoding='utf-8')
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000_000))
+
+    assert await repository.get_revision() != first_revision
+    assert await repository.get_data() == [['other_menu_id', 'Other menu', 'Other menu description']]
+
+
+async def test_sync_from_sample_file(ac: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(repositories.data_sources, 'DATA_SOURCE', 'local_file')
+
+    assert await run_in_new_session(lambda session: TaskService(session).check_data())
+
+    response = await ac.get(await reverse('get_list_menus'))
+    menus = response.json()
+
+    assert [menu['title'] for menu in menus] == ['Меню', 'Алкогольное меню']
+    assert all(menu['submenus_count'] == 2 and menu['dishes_count'] == 6 for menu in menus)
+
+    await RedisRepository().unlink('google_sheet_revision', 'google_sheet_digest', 'dishes_index_from_google_sheet')
+
+    for menu in menus:
+        await ac.delete(await reverse('delete_menu_by_id', menu_id=menu['id']))
@@ -0,0 +1,38 @@
+import socket
+
+import pytest
+from httpx import AsyncClient
+
+import celery_conf
+
+from .conftest import reverse
+
+
+async def test_get_metrics(ac: AsyncClient) -> None:
+    url = await reverse('get_list_menus')
+    await ac.get(url)
+    await ac.get(url)
+
+    url = await reverse('get_metrics')
+    response = await ac.get(url)
+
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain')
+    assert 'cache_hits_total{family="menus_list"' in response.text
+    assert 'cache_misses_total' in response.text
+    assert 'redis_command_duration_seconds_bucket' in response.text
+
+
+async def test_worker_metrics_server(monkeypatch: pytest.MonkeyPatch) -> None:
+    with socket.socket() as free_socket:
+        free_socket.bind(('127.0.0.1', 0))
+        free_port = free_socket.getsockname()[1]
+
+    monkeypatch.setattr(celery_conf, 'CELERY_WORKER_METRICS_PORT', free_port)
+    port = celery_conf.start_worker_metrics_server()
+
+    async with AsyncClient() as client:
+        response = await client.get(f'http://127.0.0.1:{port}/metrics')
+
+    assert port == free_port
+    assert 'google_sheets_request_duration_seconds' in response.text
@@ -0,0 +1,31 @@
+import uuid
+
+from database.models import Dish
+from services.pricing_service import PricingService
+
+
+def build_dishes(*prices: str) -> list[Dish]:
+    return [
+        Dish(id=uuid.uuid4(), title=f'Dish {i}', description=f'Dish description {i}', price=price)
+        for i, price in enumerate(prices)
+    ]
+
+
+async def test_price_dishes_rounds_half_up() -> None:
+    dishes = build_dishes('100', '10.05', '0.01', '19.999', '33.33')
+    discounts = {dishes[0].id: 15, dishes[1].id: 50, dishes[2].id: 50, dishes[4].id: 33}
+
+    priced_dishes = await PricingService().price_dishes(dishes, discounts)
+
+    assert [dish.price for dish in priced_dishes] == ['85.00', '5.03', '0.01', '20.00', '22.33']
+    assert [dish.id for dish in priced_dishes] == [dish.id for dish in dishes]
+    assert dishes[0].price == '100'
+
+
+async def test_price_dishes_handles_negative_prices_and_large_discounts() -> None:
+    dishes = build_dishes('-3.25', '1.00', '-0.005')
+    discounts = {dishes[1].id: 150, dishes[2].id: 10}
+
+    priced_dishes = await PricingService().price_dishes(dishes, discounts)
+
+    assert [dish.price for dish in priced_dishes] == ['-3.25', '-0.50', '-0.01']
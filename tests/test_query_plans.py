@@ -0,0 +1,72 @@
+import uuid
+from typing import Any
+
+from httpx import AsyncClient
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.dish_repository import DishRepository
+from repositories.menu_repository import MenuRepository
+from repositories.submenu_repository import SubmenuRepository
+
+from .conftest import engine_test
+
+MENUS, SUBMENUS, DISHES = 1_000, 10_000, 100_000
+
+FILL_TABLES = (
+    f"""
+    INSERT INTO menu (id, title, description)
+    SELECT md5('menu' || i)::uuid, 'Menu ' || i, '' FROM generate_series(1, {MENUS}) i
+    """,
+    f"""
+    INSERT INTO submenu (id, title, description, menu_id)
+    SELECT md5('submenu' || i)::uuid, 'Submenu ' || i, '', md5('menu' || i % {MENUS})::uuid
+    FROM generate_series(1, {SUBMENUS}) i
+    """,
+    f"""
+    INSERT INTO dish (id, title, description, price, submenu_id)
+    SELECT md5('dish' || i)::uuid, 'Dish ' || i, '', '10.00', md5('submenu' || i % {SUBMENUS})::uuid
+    FROM generate_series(1, {DISHES}) i
+    """,
+    'ANALYZE menu, submenu, dish',
+)
+
+
+async def test_hot_queries_use_indexes(ac: AsyncClient) -> None:
+    menu_id, submenu_id = uuid.UUID(int=0), uuid.UUID(int=1)
+    statements: list[tuple[str, Any]] = []
+
+    def record_statement(conn: Any, cursor: Any, statement: str, parameters: Any, *args: Any) -> None:
+        statements.append((statement, parameters))
+
+    async with engine_test.connect() as conn:
+        transaction = await conn.begin()
+        # The counter triggers are not under test and would make the fill slow.
+        await conn.execute(text('SET LOCAL session_replication_role = replica'))
+
+        for statement in FILL_TABLES:
+            await conn.execute(text(statement))
+
+        session = AsyncSession(bind=conn)
+        event.listen(engine_test.sync_engine, 'before_cursor_execute', record_statement)
+
+        try:
+            await SubmenuRepository(session).get(menu_id)
+            await DishRepository(session).get(submenu_id)
+            await MenuRepository(session).get_by_title('Menu 10')
+            await SubmenuRepository(session).get_by_title('Submenu 10')
+            await DishRepository(session).get_by_title('Dish 10')
+        finally:
+            event.remove(engine_test.sync_engine, 'before_cursor_execute', record_statement)
+
+        plans = [
+            '\n'.join((await conn.exec_driver_sql(f'EXPLAIN {statement}', parameters)).scalars())
+            for statement, parameters in statements
+        ]
+        await transaction.rollback()
+
+    assert len(plans) == 5
+
+    for plan in plans:
+        assert 'Index' in plan
+        assert 'Seq Scan' not in plan
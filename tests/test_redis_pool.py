@@ -0,0 +1,27 @@
+import asyncio
+
+from httpx import AsyncClient
+
+import database.redis_pool
+from database.redis_pool import close_redis_pool, get_redis, init_redis_pool
+
+
+async def test_exhausted_pool_waits_for_a_connection(ac: AsyncClient) -> None:
+    previous_pool = database.redis_pool.redis_pool
+    pool = init_redis_pool(max_connections=1, timeout=1)
+
+    try:
+        connection = await pool.get_connection('PING')
+
+        async def release_later() -> None:
+            await asyncio.sleep(0.1)
+            await pool.release(connection)
+
+        release_task = asyncio.create_task(release_later())
+
+        assert await get_redis().ping()
+
+        await release_task
+    finally:
+        await close_redis_pool()
+        database.redis_pool.redis_pool = previous_pool
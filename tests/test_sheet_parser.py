@@ -0,0 +1,78 @@
+import uuid
+
+from parsers.google_sheet_parser import GoogleSheetsParser
+
+MENU_ID = str(uuid.uuid4())
+SUBMENU_ID = str(uuid.uuid4())
+FIRST_DISH_ID = str(uuid.uuid4())
+SECOND_DISH_ID = str(uuid.uuid4())
+ORPHAN_DISH_ID = str(uuid.uuid4())
+ORPHAN_SUBMENU_ID = str(uuid.uuid4())
+EARLY_DISH_ID = str(uuid.uuid4())
+NO_PRICE_DISH_ID = str(uuid.uuid4())
+BAD_DISCOUNT_DISH_ID = str(uuid.uuid4())
+DISH_ID = str(uuid.uuid4())
+
+
+async def test_parse_builds_records_and_discounts() -> None:
+    rows = [
+        [MENU_ID, 'Menu', 'Menu description'],
+        ['', SUBMENU_ID, 'Submenu', 'Submenu description'],
+        ['', '', FIRST_DISH_ID, 'First dish', 'First dish description', '10.50', '15'],
+        ['', '', SECOND_DISH_ID, 'Second dish', 'Second dish description', '20'],
+        [],
+    ]
+    parsed_sheet = await GoogleSheetsParser().parse(rows)
+
+    assert [(menu.id, menu.title, menu.description) for menu in parsed_sheet.menus] == [
+        (MENU_ID, 'Menu', 'Menu description'),
+    ]
+    assert [(submenu.id, submenu.menu_id, submenu.title) for submenu in parsed_sheet.submenus] == [
+        (SUBMENU_ID, MENU_ID, 'Submenu'),
+    ]
+    assert [(dish.id, dish.menu_id, dish.submenu_id, dish.price, dish.discount) for dish in parsed_sheet.dishes] == [
+        (FIRST_DISH_ID, MENU_ID, SUBMENU_ID, '10.50', 15),
+        (SECOND_DISH_ID, MENU_ID, SUBMENU_ID, '20', 0),
+    ]
+    assert parsed_sheet.dishes_index == {
+        'by_id': {FIRST_DISH_ID: 15, SECOND_DISH_ID: 0},
+        'by_title': {'First dish': 15, 'Second dish': 0},
+    }
+    assert set(parsed_sheet.row_digests) == {MENU_ID, SUBMENU_ID, FIRST_DISH_ID, SECOND_DISH_ID}
+    assert parsed_sheet.errors == []
+
+
+async def test_parse_reports_malformed_rows() -> None:
+    rows = [
+        ['', '', ORPHAN_DISH_ID, 'Orphan dish', 'Orphan dish description', '10'],
+        ['', ORPHAN_SUBMENU_ID, 'Orphan submenu', 'Orphan submenu description'],
+        [MENU_ID, 'Menu', 'Menu description'],
+        ['', '', EARLY_DISH_ID, 'Early dish', 'Early dish description', '10'],
+        ['', SUBMENU_ID, 'Submenu', 'Submenu description'],
+        ['', '', NO_PRICE_DISH_ID, 'No price dish', 'No price dish description'],
+        ['', '', BAD_DISCOUNT_DISH_ID, 'Bad discount dish', 'Bad discount dish description', '10', 'ten'],
+        ['', '', 'not-a-uuid', 'Invalid dish', 'Invalid dish description', '10'],
+        ['', '', DISH_ID, 'Dish', 'Dish description', '10'],
+        [MENU_ID.upper(), 'Same menu', 'Same menu description'],
+    ]
+    parsed_sheet = await GoogleSheetsParser().parse(rows)
+
+    assert [(error.number, error.reason) for error in parsed_sheet.errors] == [
+        (1, 'dish row without a valid submenu'),
+        (2, 'submenu row without a valid menu'),
+        (4, 'dish row without a valid submenu'),
+        (6, 'dish row without price'),
+        (7, "invalid discount 'ten'"),
+        (8, "invalid dish id 'not-a-uuid'"),
+    ]
+    assert [dish.id for dish in parsed_sheet.dishes] == [DISH_ID]
+    assert [menu.id for menu in parsed_sheet.menus] == [MENU_ID, MENU_ID]
+
+
+async def test_row_digest_covers_parent() -> None:
+    other_menu_id = str(uuid.uuid4())
+    submenu_row = ['', SUBMENU_ID, 'Submenu', 'Submenu description']
+    first_sheet = await GoogleSheetsParser().parse([[MENU_ID, 'Menu', 'Menu description'], submenu_row])
+    second_sheet = await GoogleSheetsParser().parse([[other_menu_id, 'Menu', 'Menu description'], submenu_row])
+
+    assert first_sheet.submenus[0].digest != second_sheet.submenus[0].digest
@@ -0,0 +1,289 @@
+import uuid
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event
+
+from config import SYNC_MAX_INTERVAL
+from database.database import run_in_new_session
+from parsers.google_sheet_parser import GoogleSheetsParser, ParsedSheet
+from repositories.dish_repository import DishRepository
+from repositories.google_sheets_repository import GoogleSheetsRepository
+from repositories.menu_repository import MenuRepository
+from repositories.redis_repository import RedisRepository
+from repositories.submenu_repository import SubmenuRepository
+from services.cache_warmup_service import CacheWarmupService
+from services.task_service import TaskService
+
+from .conftest import engine_test, reverse
+
+MENU_ID, SUBMENU_ID, DISH_ID = (str(uuid.uuid4()) for _ in range(3))
+
+
+def build_rows(dish_price: str = '10.00') -> list[list]:
+    return [
+        [MENU_ID, 'Synced menu', 'Synced menu description'],
+        ['', SUBMENU_ID, 'Synced submenu', 'Synced submenu description'],
+        ['', '', DISH_ID, 'Synced dish', 'Synced dish description', dish_price, '10'],
+    ]
+
+
+class FakeSheet:
+    def __init__(self, rows: list[list], revision: str | None = None) -> None:
+        self.rows = rows
+        self.revision = revision
+        self.downloads = 0
+
+    async def get_data(self) -> list[list]:
+        self.downloads += 1
+        return self.rows
+
+    async def get_revision(self) -> str | None:
+        return self.revision
+
+
+@pytest.fixture
+def sheet(monkeypatch: pytest.MonkeyPatch) -> FakeSheet:
+    fake_sheet = FakeSheet(build_rows())
+    monkeypatch.setattr(GoogleSheetsRepository, 'get_data', fake_sheet.get_data)
+    monkeypatch.setattr(GoogleSheetsRepository, 'get_revision', fake_sheet.get_revision)
+
+    return fake_sheet
+
+
+async def check_data() -> bool:
+    return await run_in_new_session(lambda session: TaskService(session).check_data())
+
+
+async def test_sync_creates_menu_tree(ac: AsyncClient, sheet: FakeSheet) -> None:
+    await check_data()
+
+    url = await reverse('get_dish_by_id', menu_id=MENU_ID, submenu_id=SUBMENU_ID, dish_id=DISH_ID)
+    response = await ac.get(url)
+
+    assert response.status_code == 200
+    assert response.json()['price'] == '9.00'
+
+
+async def test_sync_skips_unchanged_digest(ac: AsyncClient, sheet: FakeSheet,
+                                           monkeypatch: pytest.MonkeyPatch) -> None:
+    async def parse(*args: Any) -> ParsedSheet:
+        raise AssertionError('unchanged sheet must not be parsed')
+
+    monkeypatch.setattr(GoogleSheetsParser, 'parse', parse)
+
+    await check_data()
+
+    assert sheet.downloads == 1
+
+
+async def test_sync_updates_changed_rows(ac: AsyncClient, sheet: FakeSheet) -> None:
+    sheet.rows = build_rows(dish_price='20.00')
+
+    await check_data()
+
+    url = await reverse('get_dish_by_id', menu_id=MENU_ID, submenu_id=SUBMENU_ID, dish_id=DISH_ID)
+    response = await ac.get(url)
+
+    assert response.json()['price'] == '18.00'
+
+
+async def test_sync_reports_no_change_after_digest_expired(ac: AsyncClient, sheet: FakeSheet) -> None:
+    sheet.rows = build_rows(dish_price='20.00')
+    await RedisRepository().unlink('google_sheet_digest')
+
+    assert not await check_data()
+    assert sheet.downloads == 1
+
+
+async def test_sync_writes_changes_in_bulk(ac: AsyncClient, sheet: FakeSheet, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def warm_up(self: CacheWarmupService, **kwargs: Any) -> int:
+        return 0
+
+    sheet.rows = build_rows(dish_price='25.00') + [
+        ['', '', str(uuid.uuid4()), f'Synced dish {i}', 'Synced dish description', '10.00'] for i in range(10)
+    ]
+    statements: list[str] = []
+
+    def count_statement(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    monkeypatch.setattr(CacheWarmupService, 'warm_up', warm_up)
+    event.listen(engine_test.sync_engine, 'before_cursor_execute', count_statement)
+
+    try:
+        await check_data()
+    finally:
+        event.remove(engine_test.sync_engine, 'before_cursor_execute', count_statement)
+
+    assert len(statements) == 4
+    assert len([statement for statement in statements if statement.startswith('INSERT INTO dish')]) == 1
+
+
+async def test_sync_writes_only_changed_rows(ac: AsyncClient, sheet: FakeSheet,
+                                             monkeypatch: pytest.MonkeyPatch) -> None:
+    extra_dishes = [
+        ['', '', str(uuid.uuid4()), f'Extra dish {i}', 'Extra dish description', '10.00'] for i in range(10)
+    ]
+    sheet.rows = build_rows(dish_price='25.00') + extra_dishes
+    await check_data()
+
+    written_rows: dict[str, list] = {}
+
+    def record_upsert(name: str) -> Any:
+        async def upsert_many(self: Any, rows: list[dict[str, Any]]) -> None:
+            written_rows[name] = rows
+
+        return upsert_many
+
+    for repository in (MenuRepository, SubmenuRepository, DishRepository):
+        monkeypatch.setattr(repository, 'upsert_many', record_upsert(repository.__name__))
+
+    extra_dishes[3] = [*extra_dishes[3][:5], '12.00']
+    sheet.rows = build_rows(dish_price='25.00') + extra_dishes
+    await check_data()
+
+    assert written_rows['MenuRepository'] == written_rows['SubmenuRepository'] == []
+    assert [(str(row['id']), row['price']) for row in written_rows['DishRepository']] == [(extra_dishes[3][2], '12.00')]
+
+
+async def test_sync_deletes_rows_missing_from_sheet(ac: AsyncClient, sheet: FakeSheet) -> None:
+    extra_submenu_id, extra_dish_id = str(uuid.uuid4()), str(uuid.uuid4())
+    sheet.rows = build_rows() + [
+        ['', extra_submenu_id, 'Extra submenu', 'Extra submenu description'],
+        ['', '', extra_dish_id, 'Extra dish', 'Extra dish description', '5.00'],
+    ]
+    await check_data()
+
+    submenu_url = await reverse('get_submenu_by_id', menu_id=MENU_ID, submenu_id=extra_submenu_id)
+    dish_url = await reverse('get_dish_by_id', menu_id=MENU_ID, submenu_id=SUBMENU_ID, dish_id=DISH_ID)
+    submenus_url = await reverse('get_list_submenus', menu_id=MENU_ID)
+
+    assert (await ac.get(submenu_url)).status_code == 200
+    assert len((await ac.get(submenus_url)).json()) == 2
+
+    sheet.rows = build_rows()
+    sheet.rows[-1][-1] = 'not a discount'
+    await check_data()
+
+    assert (await ac.get(submenu_url)).status_code == 404
+    assert (await ac.get(dish_url)).status_code == 200
+    assert len((await ac.get(submenus_url)).json()) == 1
+
+
+async def test_sync_invalidates_touched_menus_once(ac: AsyncClient, sheet: FakeSheet,
+                                                   monkeypatch: pytest.MonkeyPatch) -> None:
+    other_menu_id = str(uuid.uuid4())
+    other_menu_row = [other_menu_id, 'Other menu', 'Other menu description']
+    sheet.rows = build_rows(dish_price='40.00') + [other_menu_row]
+    await check_data()
+    await ac.get(await reverse('get_menu_by_id', menu_id=other_menu_id))
+
+    invalidations = []
+    invalidate = RedisRepository.invalidate
+
+    async def count_invalidation(self: RedisRepository, *keys: Any, tags: Any = ()) -> None:
+        invalidations.append((keys, tags))
+        await invalidate(self, *keys, tags=tags)
+
+    monkeypatch.setattr(RedisRepository, 'invalidate', count_invalidation)
+    sheet.rows = build_rows(dish_price='41.00') + [other_menu_row]
+    await check_data()
+
+    assert len(invalidations) == 1
+    assert set(invalidations[0][1]) == {SUBMENU_ID}
+    assert await RedisRepository().get(other_menu_id) is not None
+
+
+async def test_sync_warms_only_touched_lists(ac: AsyncClient, sheet: FakeSheet,
+                                             monkeypatch: pytest.MonkeyPatch) -> None:
+    other_menu_id = str(uuid.uuid4())
+    other_rows = [
+        [other_menu_id, 'Other menu', 'Other menu description'],
+        ['', str(uuid.uuid4()), 'Other submenu', 'Other submenu description'],
+    ]
+    sheet.rows = build_rows(dish_price='42.00') + other_rows
+    await check_data()
+
+    warm_ups = []
+
+    async def warm_up(self: CacheWarmupService, **kwargs: Any) -> int:
+        warm_ups.append(kwargs)
+        return 0
+
+    monkeypatch.setattr(CacheWarmupService, 'warm_up', warm_up)
+    sheet.rows = build_rows(dish_price='43.00') + other_rows
+    await check_data()
+
+    assert warm_ups == [{
+        'menu_ids': [uuid.UUID(MENU_ID)],
+        'submenu_ids': [(uuid.UUID(MENU_ID), uuid.UUID(SUBMENU_ID))],
+    }]
+
+
+async def test_sync_skips_download_for_same_revision(ac: AsyncClient, sheet: FakeSheet) -> None:
+    sheet.revision = '2024-02-01T10:00:00.000Z'
+    sheet.rows = build_rows(dish_price='30.00')
+
+    await check_data()
+    await check_data()
+
+    assert sheet.downloads == 1
+
+
+async def test_sync_markers_outlive_backoff(ac: AsyncClient, sheet: FakeSheet) -> None:
+    redis = RedisRepository()
+    sheet.revision = '2024-02-01T11:00:00.000Z'
+
+    await check_data()
+
+    for key in ('google_sheet_digest', 'google_sheet_revision'):
+        assert await redis.redis.ttl(await redis.converter.generate_key(key)) > SYNC_MAX_INTERVAL
+
+
+async def test_sync_keeps_parent_of_malformed_rows(ac: AsyncClient, sheet: FakeSheet) -> None:
+    other_menu_id = str(uuid.uuid4())
+    other_rows = [
+        ['', str(uuid.uuid4()), 'Other submenu', 'Other submenu description'],
+        ['', '', str(uuid.uuid4()), 'Other dish', 'Other dish description', '5.00'],
+    ]
+    sheet.rows = build_rows() + [[other_menu_id, 'Other menu', 'Other menu description'], *other_rows]
+    await check_data()
+
+    sheet.rows = build_rows() + [['not a menu id', 'Other menu', 'Other menu description'], *other_rows]
+    await check_data()
+
+    response = await ac.get(await reverse('get_menu_by_id', menu_id=other_menu_id))
+
+    assert response.status_code == 200
+    assert response.json()['submenus_count'] == 1
+
+
+async def test_sync_keeps_counts(ac: AsyncClient, sheet: FakeSheet) -> None:
+    other_submenu_id, other_dish_id = str(uuid.uuid4()), str(uuid.uuid4())
+    other_dish_row = ['', '', other_dish_id, 'Other dish', 'Other dish description', '5.00']
+    menu_url = await reverse('get_menu_by_id', menu_id=MENU_ID)
+    submenu_url = await reverse('get_submenu_by_id', menu_id=MENU_ID, submenu_id=SUBMENU_ID)
+
+    sheet.rows = build_rows() + [['', other_submenu_id, 'Other submenu', 'Other submenu description'], other_dish_row]
+    await check_data()
+    menu = (await ac.get(menu_url)).json()
+
+    assert (menu['submenus_count'], menu['dishes_count']) == (2, 2)
+
+    sheet.rows = build_rows() + [other_dish_row]
+    await check_data()
+    menu = (await ac.get(menu_url)).json()
+
+    assert (menu['submenus_count'], menu['dishes_count']) == (1, 2)
+    assert (await ac.get(submenu_url)).json()['dishes_count'] == 2
+
+
+async def test_delete_synced_menu(ac: AsyncClient) -> None:
+    await RedisRepository().unlink('google_sheet_revision', 'google_sheet_digest', 'dishes_index_from_google_sheet')
+
+    url = await reverse('delete_menu_by_id', menu_id=MENU_ID)
+    response = await ac.delete(url)
+
+    assert response.status_code == 200
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from repositories.redis_repository import RedisRepository
+from services.sync_service import SyncService
+from services.task_service import TaskService
+
+from .conftest import reverse
+
+
+async def test_lease_is_exclusive(ac: AsyncClient) -> None:
+    redis = RedisRepository()
+
+    async with redis.lease('test_lease', ttl=10) as acquired:
+        async with redis.lease('test_lease', ttl=10) as acquired_again:
+            assert acquired
+            assert not acquired_again
+
+    async with redis.lease('test_lease', ttl=10) as acquired:
+        assert acquired
+
+
+async def test_lease_heartbeat_extends_lock(ac: AsyncClient) -> None:
+    redis = RedisRepository()
+
+    async with redis.lease('test_lease', ttl=1) as acquired:
+        await asyncio.sleep(1.5)
+
+        assert acquired
+        assert await redis.redis.exists('lock_test_lease')
+
+    assert not await redis.redis.exists('lock_test_lease')
+
+
+async def test_overlapping_runs_are_skipped_and_coalesced(ac: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    await RedisRepository().unlink('sheet_sync_skipped', 'sheet_sync_pending')
+    started, release = asyncio.Event(), asyncio.Event()
+    runs: list[int] = []
+
+    async def check_data(self: TaskService) -> bool:
+        runs.append(len(runs))
+        started.set()
+        await release.wait()
+
+        return True
+
+    monkeypatch.setattr(TaskService, 'check_data', check_data)
+
+    running_sync = asyncio.create_task(SyncService().run())
+    await started.wait()
+
+    assert not await SyncService().run()
+    assert not await SyncService().run()
+
+    release.set()
+
+    assert await running_sync
+    assert len(runs) == 2
+    assert await SyncService().get_skipped_runs() == 2
+
+    response = await ac.get(await reverse('get_metrics'))
+
+    assert 'sheet_sync_skipped_runs 2.0' in response.text
@@ -0,0 +1,105 @@
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+
+import routes.routes_for_sync
+import services.sync_service
+from celery_conf import check_google_sheets
+from repositories.redis_repository import RedisRepository
+from services.sync_service import SyncService
+from services.task_service import TaskService
+
+from .conftest import reverse
+
+SYNC_KEYS = ('sheet_sync_backoff', 'sheet_sync_unchanged_runs', 'sheet_sync_requested')
+
+
+@pytest.fixture
+def sheet_changes(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    changes: list[bool] = []
+
+    async def check_data(self: TaskService) -> bool:
+        return changes.pop(0)
+
+    monkeypatch.setattr(TaskService, 'check_data', check_data)
+
+    return changes
+
+
+async def test_unchanged_sheet_backs_off(ac: AsyncClient, sheet_changes: list[bool]) -> None:
+    redis = RedisRepository()
+    await redis.unlink(*SYNC_KEYS)
+    sheet_changes.extend([False, False])
+
+    assert await SyncService().run()
+    assert await redis.redis.ttl('sheet_sync_backoff') == 15
+    assert not await SyncService().run()
+
+    assert await SyncService().run(force=True)
+    assert await redis.redis.ttl('sheet_sync_backoff') == 45
+
+
+async def test_changed_sheet_resets_backoff(ac: AsyncClient, sheet_changes: list[bool]) -> None:
+    await RedisRepository().unlink(*SYNC_KEYS)
+    sheet_changes.extend([False, True])
+
+    assert await SyncService().run()
+    assert await SyncService().run(force=True)
+    assert not await RedisRepository().has_flag('sheet_sync_backoff')
+    assert await RedisRepository().get_counter('sheet_sync_unchanged_runs') == 0
+
+
+async def test_backoff_is_capped(ac: AsyncClient, sheet_changes: list[bool]) -> None:
+    await RedisRepository().unlink(*SYNC_KEYS)
+    sheet_changes.extend([False] * 12)
+
+    for _ in range(12):
+        await SyncService().run(force=True)
+
+    assert await RedisRepository().redis.ttl('sheet_sync_backoff') == 585
+
+    await RedisRepository().unlink(*SYNC_KEYS)
+
+
+async def test_no_backoff_when_max_interval_is_poll_interval(ac: AsyncClient, sheet_changes: list[bool],
+                                                             monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(services.sync_service, 'SYNC_MAX_INTERVAL', services.sync_service.SYNC_POLL_INTERVAL)
+    await RedisRepository().unlink(*SYNC_KEYS)
+    sheet_changes.extend([False, False])
+
+    assert await SyncService().run()
+    assert await SyncService().run()
+    assert not await RedisRepository().has_flag('sheet_sync_backoff')
+
+    await RedisRepository().unlink(*SYNC_KEYS)
+
+
+async def test_trigger_sync_requires_token(ac: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(routes.routes_for_sync, 'SYNC_API_TOKEN', 'secret')
+    url = await reverse('trigger_sync')
+
+    assert (await ac.post(url)).status_code == 401
+    assert (await ac.post(url, headers={'X-Sync-Token': 'wrong'})).status_code == 401
+
+
+async def test_trigger_sync_is_debounced(ac: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    await RedisRepository().unlink(*SYNC_KEYS)
+    scheduled = []
+
+    def apply_async(**kwargs: Any) -> None:
+        scheduled.append(kwargs)
+
+    monkeypatch.setattr(routes.routes_for_sync, 'SYNC_API_TOKEN', 'secret')
+    monkeypatch.setattr(check_google_sheets, 'apply_async', apply_async)
+    url = await reverse('trigger_sync')
+
+    first_response = await ac.post(url, headers={'X-Sync-Token': 'secret'})
+    second_response = await ac.post(url, headers={'X-Sync-Token': 'secret'})
+
+    assert first_response.status_code == 202
+    assert first_response.json()['status'] is True
+    assert second_response.json()['status'] is False
+    assert scheduled == [{'kwargs': {'force': True}, 'countdown': 5}]
+
+    await RedisRepository().unlink(*SYNC_KEYS)
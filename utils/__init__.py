@@ -1 +1 @@
-from . import schemas
+from . import metrics, responses, schemas, serializers
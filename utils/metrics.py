@@ -0,0 +1,32 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+CACHE_HITS = Counter('cache_hits_total', 'Cache hits by key family and cache layer', ['family', 'layer'])
+CACHE_MISSES = Counter('cache_misses_total', 'Cache misses by key family', ['family'])
+CACHE_SETS = Counter('cache_sets_total', 'Cache writes by key family', ['family'])
+CACHE_INVALIDATIONS = Counter('cache_invalidations_total', 'Invalidation messages received from any process')
+CACHE_INVALIDATED_KEYS = Counter('cache_invalidated_keys_total', 'Invalidated keys by key family', ['family'])
+CACHE_INVALIDATION_SIZE = Histogram(
+    'cache_invalidation_size', 'Keys deleted per invalidation',
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+REDIS_LATENCY = Histogram('redis_command_duration_seconds', 'Redis round-trip latency', ['operation'])
+POSTGRES_LATENCY = Histogram('postgres_query_duration_seconds', 'Postgres statement latency')
+GOOGLE_SHEETS_LATENCY = Histogram('google_sheets_request_duration_seconds', 'Google Sheets request latency')
+SYNC_SKIPPED_RUNS = Gauge('sheet_sync_skipped_runs', 'Sheet sync runs skipped cluster-wide while another run held the lock')
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Record the latency of every statement executed through the engine."""
+
+    @event.listens_for(engine.sync_engine, 'before_cursor_execute')
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        context.query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, 'after_cursor_execute')
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        POSTGRES_LATENCY.observe(time.perf_counter() - context.query_started_at)
@@ -0,0 +1,17 @@
+from fastapi import Request, Response, status
+
+from utils.serializers import JSONBody
+
+
+def cached_json_response(request: Request, body: JSONBody) -> Response:
+    """Send a pre-serialized body, or 304 Not Modified if the client already has it."""
+    headers = {'ETag': body.etag}
+    if_none_match = request.headers.get('if-none-match')
+
+    if if_none_match:
+        etags = {etag.strip().removeprefix('W/') for etag in if_none_match.split(',')}
+
+        if body.etag in etags or '*' in etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body.content, media_type='application/json', headers=headers)
@@ -61,5 +61,14 @@ class OutAfterDelete(BaseModel):
     message: str
 
 
+class SyncOut(BaseModel):
+    status: bool
+    message: str
+
+
 class NotFoundError(BaseModel):
     detail: str
+
+
+class UnauthorizedError(BaseModel):
+    detail: str
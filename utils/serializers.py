@@ -0,0 +1,128 @@
+import hashlib
+from typing import Any, NamedTuple, Protocol
+
+import msgpack  # type: ignore[import]
+import orjson
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from utils import schemas
+
+PAYLOAD_VERSION = 3
+JSON_BODY_PREFIX = b'\x00'
+
+CACHED_SCHEMAS: dict[str, type[BaseModel]] = {
+    schema.__name__: schema
+    for schema in (
+        schemas.MenuOut,
+        schemas.SubmenuOut,
+        schemas.DishOut,
+        schemas.MenuOutWithSubmenusAndDishes,
+    )
+}
+LIST_ADAPTERS: dict[str, TypeAdapter] = {
+    name: TypeAdapter(list[schema])  # type: ignore[valid-type]
+    for name, schema in CACHED_SCHEMAS.items()
+}
+
+
+class CachedValue(NamedTuple):
+    value: Any
+    stale_at: float
+
+
+class JSONBody(NamedTuple):
+    content: bytes
+    etag: str
+
+    @classmethod
+    def from_value(cls, value: Any) -> 'JSONBody':
+        content = to_json(value)
+        return cls(content, f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"')
+
+
+class Codec(Protocol):
+    def dumps(self, data: Any) -> bytes:
+        ...
+
+    def loads(self, data: bytes) -> Any:
+        ...
+
+
+class OrjsonCodec:
+    def dumps(self, data: Any) -> bytes:
+        return orjson.dumps(data)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec:
+    def dumps(self, data: Any) -> bytes:
+        return msgpack.packb(data)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data)
+
+
+CODECS: dict[str, type[Codec]] = {
+    'orjson': OrjsonCodec,
+    'msgpack': MsgpackCodec,
+}
+
+
+class CacheSerializer:
+    """Encodes cached values as versioned plain data instead of pickles; unreadable payloads load as a miss."""
+
+    def __init__(self, codec: str = 'orjson'):
+        self.codec = CODECS[codec]()
+
+    def dumps(self, value: Any, stale_at: float = 0.0) -> bytes:
+        if isinstance(value, JSONBody):
+            header = self.codec.dumps([PAYLOAD_VERSION, value.etag, stale_at])
+            return JSON_BODY_PREFIX + len(header).to_bytes(4, 'big') + header + value.content
+
+        schema_name = None
+        many = isinstance(value, list | tuple)
+        items = value if many else [value]
+
+        if items and type(items[0]).__name__ in CACHED_SCHEMAS:
+            schema_name = type(items[0]).__name__
+            items = LIST_ADAPTERS[schema_name].dump_python(items, mode='json')
+
+        data = items if many else items[0]
+        return self.codec.dumps([PAYLOAD_VERSION, schema_name, many, data, stale_at])
+
+    def loads(self, payload: bytes) -> CachedValue | None:
+        try:
+            if payload[:1] == JSON_BODY_PREFIX:
+                return self._loads_json_body(payload)
+
+            version, schema_name, many, data, stale_at = self.codec.loads(payload)
+
+            if version != PAYLOAD_VERSION:
+                return None
+
+            if schema_name is None:
+                return CachedValue(data, stale_at)
+
+            adapter = LIST_ADAPTERS.get(schema_name)
+
+            if adapter is None:
+                return None
+
+            if many:
+                return CachedValue(adapter.validate_python(data), stale_at)
+
+            return CachedValue(adapter.validate_python([data])[0], stale_at)
+        except (ValueError, TypeError):
+            return None
+
+    def _loads_json_body(self, payload: bytes) -> CachedValue | None:
+        header_end = 5 + int.from_bytes(payload[1:5], 'big')
+        version, etag, stale_at = self.codec.loads(payload[5:header_end])
+
+        if version != PAYLOAD_VERSION:
+            return None
+
+        return CachedValue(JSONBody(payload[header_end:], etag), stale_at)